@@ -67,7 +67,7 @@ class Convolve(AudioModule):
         """
 
         # Get audio input
-        x = self.input_nodes[0].receive(frames) if self.input_nodes[0] else np.zeros((frames, 2))
+        x = self.input_nodes[0].receive(frames) if self.input_nodes[0] else np.zeros((frames, 2), dtype=np.float32)
         # Get IR (second input)
         ir = self.input_nodes[1].receive(frames) if self.input_nodes[1] else None
 
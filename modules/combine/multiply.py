@@ -16,8 +16,8 @@ class Multiply(AudioModule):
 
     def generate(self, frames: int) -> np.ndarray:
         # Receive inputs
-        x1 = self.input_nodes[0].receive(frames) if self.input_nodes[0] else np.zeros((frames, 2))
-        x2 = self.input_nodes[1].receive(frames) if self.input_nodes[1] else np.zeros((frames, 2))
+        x1 = self.input_nodes[0].receive(frames) if self.input_nodes[0] else np.zeros((frames, 2), dtype=np.float32)
+        x2 = self.input_nodes[1].receive(frames) if self.input_nodes[1] else np.zeros((frames, 2), dtype=np.float32)
 
         out =  (x1 + 1 - self.crossfade) * (x2 - 1 + self.crossfade)
         return out.astype(np.float32)
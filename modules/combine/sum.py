@@ -4,16 +4,13 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QHBoxLayout, QSlider, QPushButton, QSpacerItem, QSizePolicy
 )
 from PyQt6.QtCore import Qt
-from source.audio_module import AudioModule
+from source import audio_buffer_pool
+from source.audio_module import AudioModule, db_to_linear
 
 DB_MIN = -80.0
 DB_MAX = 10.0
 
 
-def db_to_linear(db_value: float) -> float:
-    return 10.0 ** (db_value / 20.0)
-
-
 class Sum(AudioModule):
     """4:1 mixer with per-input faders, mutes, and a master fader."""
 
@@ -27,24 +24,40 @@ class Sum(AudioModule):
         self.input_muted = [False, False, False, False]
         self.master_muted = False
 
+        self._refresh_gains()
+
+    def _refresh_gains(self):
+        """Cache linear gains; called whenever a fader moves, not per block."""
+        self._input_gain = [np.float32(db_to_linear(db)) for db in self.input_db]
+        self._master_gain = np.float32(db_to_linear(self.master_db))
+
+    def prepare(self, frames: int):
+        super().prepare(frames)
+        # Only Sum accumulates into _get_output_buffer, so only it warms one
+        if not audio_buffer_pool.USE_POOL:
+            self._output_buf = np.zeros((frames, 2), dtype=np.float32)
+
     def generate(self, frames: int) -> np.ndarray:
-        out = np.zeros((frames, 2), dtype=np.float32)
+        # Single reusable (or pooled) accumulator
+        out = self._get_output_buffer(frames)
 
         # Mix all inputs
         for i in range(4):
-            if self.input_nodes[i]:
-                inp = self.input_nodes[i].receive(frames)
-                if self.input_muted[i]:
-                    inp = np.zeros_like(inp)
-                gain = db_to_linear(self.input_db[i])
-                out += inp * gain
+            node = self.input_nodes[i]
+            if node.connection is None:
+                continue
+            inp = node.receive(frames)  # pulled even when muted to keep upstream running
+            if self.input_muted[i]:
+                continue
+            out += inp * self._input_gain[i]
 
         # Apply master mute and gain
         if self.master_muted:
-            return np.zeros_like(out)
+            out.fill(0.0)
+            return out
 
-        out *= db_to_linear(self.master_db)
-        out = np.clip(out, -1.0, 1.0)
+        out *= self._master_gain
+        np.clip(out, -1.0, 1.0, out=out)
         return out
 
     def get_ui(self) -> QWidget:
@@ -113,6 +126,7 @@ class Sum(AudioModule):
                         self.input_db[idx] = db_val
                     else:
                         self.master_db = db_val
+                    self._refresh_gains()
                 return on_value_change
 
             slider.valueChanged.connect(make_slider_cb())
@@ -158,4 +172,5 @@ class Sum(AudioModule):
         self.input_db = state.get("input_db", [-6.0, -6.0, -6.0, -6.0])
         self.master_db = state.get("master_db", 0.0)
         self.input_muted = state.get("input_muted", [False, False, False, False])
-        self.master_muted = state.get("master_muted", False)
\ No newline at end of file
+        self.master_muted = state.get("master_muted", False)
+        self._refresh_gains()
\ No newline at end of file
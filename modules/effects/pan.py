@@ -4,6 +4,11 @@ from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QSlider
 from PyQt6.QtCore import Qt
 from source.audio_module import AudioModule
 
+# Constant-power gains for each of the slider's 201 positions (-100..100),
+# as a (1, 2) [left, right] row ready to broadcast over a stereo block
+_PAN_ANGLES = (np.arange(-100, 101) / 100.0 + 1) * np.pi / 4  # -1..1 -> 0..pi/2
+_PAN_LUT = np.stack([np.cos(_PAN_ANGLES), np.sin(_PAN_ANGLES)], axis=1).astype(np.float32)[:, None, :]
+
 class Pan(AudioModule):
     """Simple stereo panning module."""
 
@@ -16,12 +21,8 @@ class Pan(AudioModule):
             return np.zeros((frames, 2), dtype=np.float32)
 
         x = self.input_node.receive(frames)
-        left_gain = np.cos((self.pan + 1) * np.pi / 4)  # convert -1..1 to 0..pi/2
-        right_gain = np.sin((self.pan + 1) * np.pi / 4)
-        y = np.zeros_like(x)
-        y[:, 0] = x[:, 0] * left_gain
-        y[:, 1] = x[:, 1] * right_gain
-        return y.astype(np.float32)
+        idx = min(max(int(round(self.pan * 100)), -100), 100) + 100
+        return np.multiply(x, _PAN_LUT[idx], dtype=np.float32)
 
     def get_ui(self) -> QWidget:
         """Return a QWidget with a pan slider."""
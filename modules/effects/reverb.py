@@ -37,23 +37,35 @@ class Reverb(AudioModule):
         # Ensure buffer is at least as long as 'delay'
         if len(buf) < delay:
             buf = np.concatenate([buf, np.zeros(delay - len(buf), dtype=np.float32)])
-        
-        out = np.zeros_like(x)
-        for i in range(len(x)):
-            y = buf[idx]
-            out[i] = y
-            buf[idx] = x[i] + feedback * y
-            idx = (idx + 1) % delay
+
+        # Each sample reads a delay slot before overwriting that same slot, so
+        # any contiguous run of at most 'delay' samples has no intra-run
+        # dependency and can be processed as one vector operation. After
+        # room_size shrinks, the saved idx can lie past the new delay; like
+        # the per-sample loop, that slot is used for one sample, then idx wraps.
+        out = np.empty_like(x)
+        i, n = 0, len(x)
+        while i < n:
+            run = min(delay - idx, n - i) if idx < delay else 1
+            y = out[i:i + run]
+            y[:] = buf[idx:idx + run]
+            buf[idx:idx + run] = x[i:i + run] + feedback * y
+            i += run
+            idx = (idx + run) % delay
         return out, buf, idx
 
     def _allpass_filter(self, x, buf, idx, delay, feedback=0.5):
-        out = np.zeros_like(x)
-        for i in range(len(x)):
-            buf_out = buf[idx]
-            y = -feedback * x[i] + buf_out
-            buf[idx] = x[i] + feedback * y
-            out[i] = y
-            idx = (idx + 1) % delay
+        # Same read-then-write slot pattern as the comb filter (see above)
+        out = np.empty_like(x)
+        i, n = 0, len(x)
+        while i < n:
+            run = min(delay - idx, n - i) if idx < delay else 1
+            xs = x[i:i + run]
+            y = buf[idx:idx + run] - feedback * xs
+            buf[idx:idx + run] = xs + feedback * y
+            out[i:i + run] = y
+            i += run
+            idx = (idx + run) % delay
         return out, buf, idx
 
     def generate(self, frames: int) -> np.ndarray:
@@ -3,6 +3,7 @@ from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QSlider
 from PyQt6.QtCore import Qt
 from source.audio_module import AudioModule
 from source.nodes import InputNode, OutputNode
+from source.audio_kernels import reverse_delay
 
 
 class ReverseDelay(AudioModule):
@@ -33,24 +34,9 @@ class ReverseDelay(AudioModule):
         if x is None:
             return np.zeros((frames, 2), dtype=np.float32)
 
-        # Reverse buffer processing
-        y = np.zeros_like(x)
-
-        for i in range(frames):
-            # Write incoming sample to buffer
-            self.buffer[self.write_index] = x[i]
-
-            # Compute reversed read index
-            rev_index = (self.buffer_size - 1 - self.write_index) % self.buffer_size
-            reversed_sample = self.buffer[rev_index]
-
-            # Mix reversed echo with dry
-            y[i] = (1.0 - self.mix) * x[i] + self.mix * reversed_sample
-
-            # Increment circular buffer
-            self.write_index = (self.write_index + 1) % self.buffer_size
-
-        return y.astype(np.float32)
+        # Reverse buffer processing (whole block, see audio_kernels)
+        y, self.write_index = reverse_delay(x, self.buffer, self.write_index, self.mix)
+        return y
 
     # --------------------------------------------------------
     def get_ui(self) -> QWidget:
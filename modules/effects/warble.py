@@ -1,5 +1,6 @@
 # modules/speed_warble.py
 import numpy as np
+from scipy.signal import lfilter
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSlider, QCheckBox
 )
@@ -74,41 +75,43 @@ class Warble(AudioModule):
         # How many seconds one block represents (assume 44100 if unknown)
         block_dur = frames / 44100.0
 
-        out = np.empty((frames, 2), dtype=np.float32)
         ring = self._ring
         size = self._RING_SIZE
 
-        rp = self._read_pos
-        speed = self._current_speed
-        target = self._target_speed
-        phase = self._phase
-
-        for i in range(frames):
-            # --- Decide whether to pick a new random target ---
-            phase += self.rate / 44100.0
-            if phase >= 1.0:
-                phase -= 1.0
-                target = self._rng.uniform(min_speed, max_speed)
-
-            # --- Smooth toward target ---
-            speed += alpha * (target - speed)
-
-            # --- Read with linear interpolation ---
-            idx = int(rp) % size
-            frac = rp - int(rp)
-            idx_next = (idx + 1) % size
-            sample = ring[idx] * (1.0 - frac) + ring[idx_next] * frac
-            out[i] = sample
-
-            rp += speed
+        # --- Random target per sample: a new one is drawn each time the
+        #     phase accumulator wraps past 1.0 ---
+        phase = self._phase + (self.rate / 44100.0) * np.arange(1, frames + 1)
+        wraps = np.floor(phase).astype(np.int64)
+        n_new = int(wraps[-1])
+        targets = np.empty(n_new + 1)
+        targets[0] = self._target_speed
+        if n_new:
+            targets[1:] = self._rng.uniform(min_speed, max_speed, size=n_new)
+        target = targets[wraps]
+
+        # --- Smooth toward target: one-pole lowpass
+        #     speed[n] = (1 - alpha) * speed[n-1] + alpha * target[n] ---
+        zi = [(1.0 - alpha) * self._current_speed]
+        speed, _ = lfilter([alpha], [1.0, alpha - 1.0], target, zi=zi)
+
+        # --- Read head advances by the speed of the previous sample ---
+        rp = np.empty(frames)
+        rp[0] = self._read_pos
+        np.cumsum(speed[:-1], out=rp[1:])
+        rp[1:] += self._read_pos
+
+        # --- Read with linear interpolation ---
+        base = rp.astype(np.int64)
+        frac = (rp - base).astype(np.float32)[:, None]
+        idx = base % size
+        idx_next = (idx + 1) % size
+        out = ring[idx] * (1.0 - frac) + ring[idx_next] * frac
 
         # Keep read_pos from drifting unboundedly
-        rp = rp % size
-
-        self._read_pos = rp
-        self._current_speed = speed
-        self._target_speed = target
-        self._phase = phase
+        self._read_pos = (rp[-1] + speed[-1]) % size
+        self._current_speed = float(speed[-1])
+        self._target_speed = float(targets[-1])
+        self._phase = float(phase[-1] - n_new)
 
         return out
 
@@ -2,6 +2,7 @@
 import numpy as np
 import time
 import traceback
+from collections import deque
 
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QColor, QPainter
@@ -10,13 +11,11 @@ from PyQt6.QtWidgets import (
     QHBoxLayout, QPushButton, QLineEdit
 )
 
-from source.audio_module import AudioModule
+from source.audio_module import AudioModule, db_to_linear
 
 DB_MIN = -80.0
 DB_MAX = 10.0
 
-def db_to_linear(db_value: float) -> float:
-    return 10.0 ** (db_value / 20.0)
 
 def linear_to_db(x):
     if x <= 1e-7:
@@ -97,42 +96,83 @@ class VUMeter(QWidget):
 class Endpoint(AudioModule):
     def __init__(self, volume_db=-80.0):
         super().__init__(input_count=1, output_count=0)
-        self.volume_db = volume_db
-        self.muted = False
+        self._volume_db = volume_db
+        self._muted = False
+        self._gain = np.float32(db_to_linear(volume_db))
+        self._inactive = volume_db <= DB_MIN  # fader at -∞ dB or muted
         self.nickname = ""
 
+        # Endpoint-owned output buffer, reused every block
+        self._out = None
+
         self.last_peak_level = 0.0
+        self.last_peak = 0.0  # linear peak of the last block, used by the master mix
 
         # NEW: hold all UI widgets associated with this module
         self.widgets = []
+        self._meters = ()  # VU meters of those widgets, rebuilt in get_ui
+
+        # Block levels from the audio thread, fed to the meters by drain_levels
+        # on the UI thread (deque append/popleft are atomic, no lock needed)
+        self._levels = deque(maxlen=8)
+
+    # -------------------------------------------------------------------------
+    # GAIN (recomputed on UI changes, not per block)
+    # -------------------------------------------------------------------------
+    @property
+    def volume_db(self):
+        return self._volume_db
+
+    @volume_db.setter
+    def volume_db(self, value):
+        self._volume_db = value
+        self._update_gain()
+
+    @property
+    def muted(self):
+        return self._muted
+
+    @muted.setter
+    def muted(self, value):
+        self._muted = value
+        self._update_gain()
+
+    def _update_gain(self):
+        self._inactive = self._muted or self._volume_db <= DB_MIN
+        self._gain = np.float32(0.0 if self._inactive else db_to_linear(self._volume_db))
 
     # -------------------------------------------------------------------------
     # AUDIO
     # -------------------------------------------------------------------------
-    def generate(self, frames: int) -> np.ndarray:
+    def generate(self, frames: int) -> np.ndarray | None:
+        """Return this output's block, or None when it is silent (muted or at -∞ dB)."""
         try:
             if self.input_node is None:
                 data = np.zeros((frames, 2), dtype=np.float32)
             else:
                 data = self.input_node.receive(frames)
 
-            gain = db_to_linear(self.volume_db)
-
-            if self.muted:
-                metersig = np.zeros_like(data)
-                data_out = metersig
+            if self._inactive:
+                # Upstream was still pulled so sources keep their position,
+                # but there is nothing to scale, measure or mix
+                data_out = None
+                peak = 0.0
+                peak_db = DB_MIN
             else:
-                data_out = data * gain
-                metersig = data_out
+                # Volume applied with a single cached gain into our own buffer
+                data_out = self._out
+                if data_out is None or data_out.shape != data.shape:
+                    data_out = self._out = np.empty(data.shape, dtype=np.float32)
+                np.multiply(data, self._gain, out=data_out)
+
+                peak = float(np.max(np.abs(data_out)))
+                peak_db = linear_to_db(peak)
 
-            peak = float(np.max(np.abs(metersig)))
-            peak_db = linear_to_db(peak)
+            self.last_peak = peak
             self.last_peak_level = peak_db
 
-            # update meter on all widgets
-            for ui in self.widgets:
-                if hasattr(ui, "vu_meter"):
-                    ui.vu_meter.update_level(peak_db)
+            # Meters are widgets, so only queue the level here
+            self._levels.append(peak_db)
 
             return data_out
 
@@ -141,6 +181,14 @@ class Endpoint(AudioModule):
             traceback.print_exc()
             return np.zeros((frames, 2), dtype=np.float32)
 
+    def drain_levels(self):
+        """Feed queued block levels to the VU meters. UI thread only."""
+        levels = self._levels
+        while levels:
+            peak_db = levels.popleft()
+            for meter in self._meters:
+                meter.update_level(peak_db)
+
     # -------------------------------------------------------------------------
     # UI
     # -------------------------------------------------------------------------
@@ -227,6 +275,7 @@ class Endpoint(AudioModule):
 
         # STORE UI IN MODULE
         self.widgets.append(widget)
+        self._meters = tuple(ui.vu_meter for ui in self.widgets if hasattr(ui, "vu_meter"))
 
         return widget
 
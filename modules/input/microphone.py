@@ -6,6 +6,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 from source.audio_module import AudioModule
+from source.ring_buffer import SPSCRing
 
 
 class Microphone(AudioModule):
@@ -15,13 +16,14 @@ class Microphone(AudioModule):
         super().__init__(input_count=0, output_count=1)
         self.sample_rate = sample_rate
         self.block_size = block_size
-        self.gain = gain
+        self.gain = gain  # linear input trim (0–2x); output level is set by the Endpoint fader
         self.muted = False
         
-        # Audio buffer
-        self.buffer = np.zeros((block_size * 4, 2), dtype=np.float32)
-        self.write_pos = 0
-        self.read_pos = 0
+        # Lock-free ring between the input stream callback and the engine.
+        # It must hold more than one engine block (8192 frames) plus the
+        # backlog allowed in generate(); latency is bounded there, so the
+        # capacity (~1 s) only sets how much audio is kept while unread.
+        self.ring = SPSCRing(sample_rate, channels=2)
         
         # Find default input device
         self.selected_device_index = None
@@ -43,22 +45,8 @@ class Microphone(AudioModule):
         if status:
             print(f"Sounddevice status: {status}")
         
-        # Convert to stereo if needed
-        if indata.shape[1] == 1:
-            stereo_data = np.column_stack((indata[:, 0], indata[:, 0]))
-        else:
-            stereo_data = indata[:, :2]  # Take first 2 channels if more available
-        
-        # Write to circular buffer
-        available = len(self.buffer) - self.write_pos
-        if frames <= available:
-            self.buffer[self.write_pos:self.write_pos + frames] = stereo_data
-            self.write_pos = (self.write_pos + frames) % len(self.buffer)
-        else:
-            # Wrap around
-            self.buffer[self.write_pos:] = stereo_data[:available]
-            self.buffer[:frames - available] = stereo_data[available:]
-            self.write_pos = frames - available
+        # Write straight into the ring; mono input fills both channels
+        self.ring.write_from(indata)
 
     def start_stream(self):
         """Start the audio input stream."""
@@ -92,26 +80,16 @@ class Microphone(AudioModule):
         if self.muted or self.stream is None:
             return np.zeros((frames, 2), dtype=np.float32)
         
-        # Read from circular buffer
-        output = np.zeros((frames, 2), dtype=np.float32)
-        available = (self.write_pos - self.read_pos) % len(self.buffer)
-        
-        if available >= frames:
-            if self.read_pos + frames <= len(self.buffer):
-                output[:] = self.buffer[self.read_pos:self.read_pos + frames]
-                self.read_pos = (self.read_pos + frames) % len(self.buffer)
-            else:
-                # Wrap around
-                first_part = len(self.buffer) - self.read_pos
-                output[:first_part] = self.buffer[self.read_pos:]
-                output[first_part:] = self.buffer[:frames - first_part]
-                self.read_pos = frames - first_part
-        else:
-            # Not enough data, return silence
-            pass
-        
-        # Apply gain
-        return output * self.gain
+        # Read from the ring; any shortfall is zero-filled. The stream runs
+        # from __init__, so audio captured while unconnected or muted piles
+        # up; keep only the request plus a little callback jitter.
+        output = np.empty((frames, 2), dtype=np.float32)
+        self.ring.read_into(output, max_backlog=frames + 2 * self.block_size)
+
+        # Apply gain in place (skipped at unity)
+        if self.gain != 1.0:
+            output *= np.float32(self.gain)
+        return output
 
     def get_input_devices(self):
         """Get list of available input devices."""
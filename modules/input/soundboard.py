@@ -1,13 +1,18 @@
 # modules/soundboard.py
 import os
+from bisect import insort
+from collections import deque
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import soundfile as sf
+from scipy.signal import resample_poly
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QScrollArea, QPushButton, QLabel,
     QGridLayout, QStackedWidget, QHBoxLayout, QSizePolicy
 )
-from PyQt6.QtCore import Qt, QSize
-from source.audio_module import AudioModule
+from PyQt6.QtCore import Qt, QSize, QTimer
+from source.audio_module import AudioModule, silence
 
 
 class Soundboard(AudioModule):
@@ -18,17 +23,32 @@ class Soundboard(AudioModule):
     def __init__(self, available_outputs=None):
         super().__init__(input_count=0, output_count=1)
         self.fs = 44100
-        self.active_sounds = []
+        self._queued = deque()  # clips queued from the UI thread
+        self._active_data = []  # playing clips and their read positions,
+        self._active_pos = []   # kept as parallel lists
         self.sounds = {}  # {category: {filename: np.array}}
         self.available_outputs = available_outputs or []
         self.categories = []
+
+        # Decoding runs on a thread pool; finished files queue up in
+        # _loaded and a UI-thread timer moves them into self.sounds
+        self._loaded = deque()  # (category, fname, data or None)
+        self._pending = {}  # category -> files still decoding
+        self._staged = {}   # category -> {fname: data} decoded so far
+        self._cat_layout = None  # category button list, once get_ui has run
+        self._load_timer = QTimer()
+        self._load_timer.timeout.connect(self._collect_loaded)
         self.load_all_sounds()
 
+    def destroy(self):
+        self._load_timer.stop()
+        super().destroy()
+
     # ---------------------------
     # SOUND LOADING
     # ---------------------------
     def load_all_sounds(self):
-        """Scan /sounds directory and load all supported audio files."""
+        """Scan /sounds and start decoding every supported file off the UI thread."""
         base_dir = os.path.join(os.path.dirname(__file__), "../..", "sounds")
         base_dir = os.path.abspath(base_dir)
 
@@ -36,44 +56,84 @@ class Soundboard(AudioModule):
             print(f"[Soundboard] No sounds directory at {base_dir}")
             return
 
+        # Enumerate here, decode on a pool (libsndfile and the resampler
+        # release the GIL); results are picked up by _collect_loaded
+        jobs = []  # (category, fname, path)
         for category in sorted(os.listdir(base_dir)):
             cat_path = os.path.join(base_dir, category)
             if not os.path.isdir(cat_path):
                 continue
 
-            cat_sounds = {}
             for fname in os.listdir(cat_path):
-                if not fname.lower().endswith(self.SUPPORTED_EXTENSIONS):
-                    continue
-
-                path = os.path.join(cat_path, fname)
-                try:
-                    data, fs = sf.read(path, dtype="float32")
-
-                    # Convert to stereo if mono
-                    if data.ndim == 1:
-                        data = np.column_stack((data, data))
-
-                    # Resample to target sample rate
-                    if fs != self.fs:
-                        ratio = self.fs / fs
-                        idx = np.round(np.arange(0, len(data) * ratio) / ratio).astype(int)
-                        idx = idx[idx < len(data)]
-                        data = data[idx]
-
-                    cat_sounds[fname] = data
-                except RuntimeError:
-                    # skip unsupported files
-                    continue
-                except Exception as e:
-                    print(f"[Soundboard] Failed to load {fname}: {e}")
-
-            if cat_sounds:
-                self.sounds[category] = cat_sounds
-                self.categories.append(category)
-
-        if not self.categories:
+                if fname.lower().endswith(self.SUPPORTED_EXTENSIONS):
+                    jobs.append((category, fname, os.path.join(cat_path, fname)))
+                    self._pending[category] = self._pending.get(category, 0) + 1
+
+        if not jobs:
             print("[Soundboard] No sound categories found.")
+            return
+
+        pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+        for category, fname, path in jobs:
+            future = pool.submit(self._load_one, path)
+            future.add_done_callback(partial(self._on_loaded, category, fname))
+        pool.shutdown(wait=False)  # queued jobs still run; just don't block
+        self._load_timer.start(50)
+
+    def _on_loaded(self, category, fname, future):
+        """Pool thread: hand a decoded file to the UI thread."""
+        self._loaded.append((category, fname, future.result()))
+
+    def _collect_loaded(self):
+        """UI thread: publish each category once all of its files are decoded."""
+        while self._loaded:
+            category, fname, data = self._loaded.popleft()
+            if data is not None:
+                self._staged.setdefault(category, {})[fname] = data
+            self._pending[category] -= 1
+            if self._pending[category]:
+                continue
+            del self._pending[category]
+            sounds = self._staged.pop(category, None)
+            if sounds:
+                self._add_category(category, sounds)
+
+        if not self._pending:
+            self._load_timer.stop()
+            if not self.categories:
+                print("[Soundboard] No sound categories found.")
+
+    def _add_category(self, category, sounds):
+        """Register a fully loaded category and add its button if the UI exists."""
+        self.sounds[category] = sounds
+        insort(self.categories, category)
+        if self._cat_layout is not None:
+            index = self.categories.index(category)
+            self._cat_layout.insertWidget(index, self._make_category_button(category))
+
+    def _load_one(self, path):
+        """Decode one file to contiguous float32 stereo at self.fs, or None on failure."""
+        try:
+            data, fs = sf.read(path, dtype="float32")
+
+            # Resample to target sample rate (anti-aliased, once at load)
+            if fs != self.fs:
+                data = resample_poly(data, self.fs, fs, axis=0)
+
+            # Convert to stereo if mono
+            if data.ndim == 1:
+                data = np.column_stack((data, data))
+
+            # Shared by every queued playback, so guard it against writes
+            data = np.ascontiguousarray(data, dtype=np.float32)
+            data.flags.writeable = False
+            return data
+        except RuntimeError:
+            # skip unsupported files
+            return None
+        except Exception as e:
+            print(f"[Soundboard] Failed to load {os.path.basename(path)}: {e}")
+            return None
 
     # ---------------------------
     # AUDIO PROCESSING
@@ -82,26 +142,40 @@ class Soundboard(AudioModule):
         """Queue a sound from the specified category for playback."""
         if category not in self.sounds or name not in self.sounds[category]:
             return
-        data = self.sounds[category][name].copy()
-        self.active_sounds.append({"data": data, "pos": 0})
+        # Playback only reads from the buffer, so it can be shared
+        self._queued.append(self.sounds[category][name])
 
     def apply_effect(self, frames: int):
         """Mix active sounds into the output buffer."""
-        out = np.zeros((frames, 2), dtype=np.float32)
-        new_active = []
+        while self._queued:
+            self._active_data.append(self._queued.popleft())
+            self._active_pos.append(0)
 
-        for sound in self.active_sounds:
-            start = sound["pos"]
-            end = min(start + frames, len(sound["data"]))
-            chunk = sound["data"][start:end]
-            out[:len(chunk)] += chunk
+        # Idle boards hand out the shared silence block instead of
+        # allocating a fresh one every pull
+        if not self._active_data:
+            return silence(frames)
 
-            if end < len(sound["data"]):
-                sound["pos"] = end
-                new_active.append(sound)
+        out = np.zeros((frames, 2), dtype=np.float32)
 
-        self.active_sounds = new_active
-        return np.clip(out, -1.0, 1.0)
+        data_list = self._active_data
+        pos_list = self._active_pos
+        keep = 0
+        for i in range(len(data_list)):
+            data = data_list[i]
+            start = pos_list[i]
+            end = min(start + frames, len(data))
+            n = end - start
+            np.add(out[:n], data[start:end], out=out[:n])
+
+            if end < len(data):
+                data_list[keep] = data
+                pos_list[keep] = end
+                keep += 1
+
+        del data_list[keep:]
+        del pos_list[keep:]
+        return out
 
     def generate(self, frames: int):
         """Return the current mixed output."""
@@ -138,28 +212,13 @@ class Soundboard(AudioModule):
         scroll_content.setLayout(scroll_layout)
         scroll_area.setWidget(scroll_content)
 
-        # Category buttons as vertical list
+        # Category buttons as vertical list; categories still decoding
+        # are inserted by _add_category as they finish
         for category in self.categories:
-            btn = QPushButton(category.capitalize())
-            btn.setFixedHeight(50)
-            btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #333;
-                    color: white;
-                    font-size: 16px;
-                    border-radius: 8px;
-                    text-align: left;
-                    padding-left: 20px;
-                }
-                QPushButton:hover {
-                    background-color: #555;
-                }
-            """)
-            btn.clicked.connect(lambda _, c=category: self.show_category(c))
-            scroll_layout.addWidget(btn)
+            scroll_layout.addWidget(self._make_category_button(category))
 
         scroll_layout.addStretch()
+        self._cat_layout = scroll_layout
         self.stack.addWidget(cat_screen)
 
         # Store built category screens
@@ -170,6 +229,35 @@ class Soundboard(AudioModule):
 
         return main_widget
 
+    def _make_category_button(self, category):
+        """Build the list button that opens a category."""
+        btn = QPushButton(category.capitalize())
+        btn.setFixedHeight(50)
+        btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        btn.setStyleSheet("""
+            QPushButton {
+                background-color: #333;
+                color: white;
+                font-size: 16px;
+                border-radius: 8px;
+                text-align: left;
+                padding-left: 20px;
+            }
+            QPushButton:hover {
+                background-color: #555;
+            }
+        """)
+        btn.clicked.connect(partial(self._on_category_clicked, category))
+        return btn
+
+    def _on_category_clicked(self, category, _checked=False):
+        """Category button slot; `_checked` absorbs clicked()'s argument."""
+        self.show_category(category)
+
+    def _on_sound_clicked(self, category, name, _checked=False):
+        """Sound button slot; `_checked` absorbs clicked()'s argument."""
+        self.queue_sound(category, name)
+
     def show_category(self, category):
         """Display sound buttons for the selected category."""
         if category in self.category_views:
@@ -218,7 +306,7 @@ class Soundboard(AudioModule):
                     background-color: #444;
                 }
             """)
-            btn.clicked.connect(lambda _, c=category, n=fname: self.queue_sound(c, n))
+            btn.clicked.connect(partial(self._on_sound_clicked, category, fname))
             grid.addWidget(btn, row, col)
             col += 1
             if col >= max_cols:
@@ -14,10 +14,21 @@ class Static(AudioModule):
         self.sample_rate = sample_rate
         self.amplitude = amplitude
 
+        self._rng = np.random.default_rng()
+        self._noise_buf = None
+
     def generate(self, frames: int) -> np.ndarray:
         """Generate stereo white noise."""
-        wave = np.random.uniform(low=-1.0, high=1.0, size=(frames, 2)).astype(np.float32)
-        return self.amplitude * wave
+        buf = self._noise_buf
+        if buf is None or buf.shape[0] != frames:
+            buf = self._noise_buf = np.empty((frames, 2), dtype=np.float32)
+
+        # Draw float32 noise in [0, 1) straight into the buffer, then map
+        # to [-amplitude, amplitude) in place
+        self._rng.random(dtype=np.float32, out=buf)
+        buf *= np.float32(2.0 * self.amplitude)
+        buf -= np.float32(self.amplitude)
+        return buf
 
     def get_ui(self) -> QWidget:
         """Return QWidget with amplitude slider."""
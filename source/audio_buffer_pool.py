@@ -0,0 +1,45 @@
+# audio_buffer_pool.py
+"""
+Shared pool of (frames, 2) float32 block buffers.
+
+Modules that fill a fresh output block every generate() can recycle
+buffers here instead of allocating. For blocks this small NumPy's own
+allocator is already fast, so the pool is off unless USE_POOL is set;
+measure before turning it on.
+"""
+
+from collections import deque
+
+import numpy as np
+
+USE_POOL = False
+
+
+class AudioBufferPool:
+    """Free lists of stereo float32 buffers, keyed by frame count."""
+
+    def __init__(self, max_per_size: int = 32):
+        self.max_per_size = max_per_size
+        self._free: dict[int, deque] = {}
+
+    def acquire(self, frames: int) -> np.ndarray:
+        """Pop a buffer of exactly `frames` rows, allocating if none is free. Contents are undefined."""
+        free = self._free.get(frames)
+        if free:
+            try:
+                return free.pop()
+            except IndexError:
+                pass
+        return np.empty((frames, 2), dtype=np.float32)
+
+    def release(self, buf: np.ndarray):
+        """Return a buffer to the pool. The caller must not touch it afterwards."""
+        free = self._free.get(buf.shape[0])
+        if free is None:
+            free = self._free[buf.shape[0]] = deque()
+        if len(free) < self.max_per_size:
+            free.append(buf)
+
+
+# Process-wide pool used by AudioModule._get_output_buffer when USE_POOL is on
+pool = AudioBufferPool()
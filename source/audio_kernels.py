@@ -0,0 +1,123 @@
+# audio_kernels.py
+"""
+Block-level DSP kernels shared by audio modules.
+
+Each kernel replaces a per-sample Python loop with whole-block NumPy
+operations on C-contiguous float32 (frames, 2) arrays, so the interpreter
+is out of the inner loop without needing a JIT.
+"""
+
+import numpy as np
+
+
+def ring_write(ring: np.ndarray, pos: int, data: np.ndarray) -> int:
+    """
+    Write `data` into circular buffer `ring` starting at `pos` with at most
+    two slice copies. Returns the new write position. If `data` is longer
+    than the ring only its tail survives, exactly as sample-by-sample
+    writes would leave it.
+    """
+    size = len(ring)
+    n = len(data)
+    if n >= size:
+        # Only the last `size` samples survive; they land ending at pos + n
+        pos = (pos + n - size) % size
+        data = data[-size:]
+        n = size
+
+    first = min(n, size - pos)
+    ring[pos:pos + first] = data[:first]
+    if first < n:
+        ring[:n - first] = data[first:]
+    return (pos + n) % size
+
+
+def reverse_delay(x: np.ndarray, ring: np.ndarray, pos: int, mix: float):
+    """
+    Reverse-delay mix for one block.
+
+    Per sample i the input is written at w = pos + i and the output reads
+    the mirrored slot r = size - 1 - w, so echoes play back reversed.
+    A slot last written d samples ago holds x[i - d] if that write fell
+    inside this block, otherwise it still holds the ring's old contents.
+
+    Returns (y, new_pos); `ring` is updated in place.
+    """
+    size = len(ring)
+    frames = len(x)
+    i = np.arange(frames)
+    w = (pos + i) % size
+    r = (size - 1 - w) % size
+    src = i - (w - r) % size  # sample index that last wrote slot r
+
+    reversed_part = ring[r]  # gather copies, so the in-place write below is safe
+    in_block = src >= 0
+    reversed_part[in_block] = x[src[in_block]]
+
+    y = (1.0 - mix) * x + mix * reversed_part
+    new_pos = ring_write(ring, pos, x)
+    return y.astype(np.float32, copy=False), new_pos
+
+
+def mix_blocks(blocks, out: np.ndarray) -> np.ndarray:
+    """
+    Sum a list of (frames, 2) blocks into `out` in place.
+
+    The first block is copied rather than added to a zeroed buffer, which
+    saves one full pass over `out` versus fill(0) + N adds. Blocks shorter
+    than `out` are summed over their length; the remainder stays silent.
+    """
+    frames = len(out)
+    if not blocks:
+        out.fill(0.0)
+        return out
+
+    first = blocks[0]
+    n = min(len(first), frames)
+    out[:n] = first[:n]
+    if n < frames:
+        out[n:] = 0.0
+
+    for block in blocks[1:]:
+        if len(block) >= frames:
+            np.add(out, block[:frames], out=out)
+        else:
+            out[:len(block)] += block
+    return out
+
+
+def mix_clip_scale(blocks, out: np.ndarray, gain: float, clip: bool) -> np.ndarray:
+    """
+    Master bus: sum `blocks` into `out`, clip to [-1, 1] if `clip`, then
+    scale by `gain`, using as few passes over `out` as the case allows.
+
+    A single block is never copied on its own: the clip or the gain is
+    applied on the way from the block into `out`. Unity gain skips the
+    scale pass. No blocks gives silence.
+    """
+    if len(blocks) != 1:
+        if not blocks:
+            out.fill(0.0)
+            return out
+        mix_blocks(blocks, out)
+        if clip:
+            np.clip(out, -1.0, 1.0, out=out)
+        if gain != 1.0:
+            np.multiply(out, gain, out=out)
+        return out
+
+    block = blocks[0]
+    frames = len(out)
+    n = min(len(block), frames)
+    if n < frames:
+        out[n:] = 0.0
+    dst, src = out[:n], block[:n]
+    if clip:
+        np.clip(src, -1.0, 1.0, out=dst)
+        if gain != 1.0:
+            np.multiply(dst, gain, out=dst)
+    elif gain != 1.0:
+        np.multiply(src, gain, out=dst)
+    else:
+        dst[...] = src
+    return out
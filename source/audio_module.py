@@ -1,10 +1,80 @@
 # audio_module.py
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
+from typing import TYPE_CHECKING
 import numpy as np
 from source.nodes import Node
-from PyQt6.QtWidgets import QWidget
+from source import audio_buffer_pool
+
+if TYPE_CHECKING:
+    # Only needed for annotations; importing Qt widgets is not free
+    from PyQt6.QtWidgets import QWidget
+
+
+@lru_cache(maxsize=64)
+def _make_default(value, count: int) -> tuple:
+    """Shared read-only default attribute list, e.g. ("audio",) * count."""
+    return (value,) * count
+
+
+def _resolve(name: str, value: list | None, default, count: int) -> list | tuple:
+    """
+    Return `value`, or `count` copies of `default` if it is None.
+
+    A wrong length is a bug in the module's constructor call, not bad user
+    data, so it is checked with assert (stripped under `python -O`).
+    Saved layouts go through deserialize, which tolerates short lists.
+    """
+    if value is None:
+        return _make_default(default, count)
+    assert len(value) == count, \
+        f"{name} length ({len(value)}) must match {name.split('_', 1)[0]}_count ({count})"
+    return value
+
+
+@lru_cache(maxsize=4)
+def silence(frames: int) -> np.ndarray:
+    """
+    Shared read-only (frames, 2) float32 zero block. The engine runs at a
+    fixed block size, so this settles to one array for the whole process;
+    the small LRU bound keeps odd sizes (sub-block pulls) from piling up.
+    """
+    buf = np.zeros((frames, 2), dtype=np.float32)
+    buf.flags.writeable = False
+    return buf
+
+
+def db_to_linear(db_value: float) -> float:
+    """Convert a gain in dB to a linear amplitude factor."""
+    return 10.0 ** (db_value / 20.0)
+
+
+_NODE_FIELDS = attrgetter("data_type", "color", "position", "label")
+
+
+def _node_columns(nodes) -> tuple[list, list, list, list]:
+    """Unzip nodes into (data_types, colors, positions, labels) lists in a single pass."""
+    if not nodes:
+        return [], [], [], []
+    return tuple(map(list, zip(*map(_NODE_FIELDS, nodes))))
+
 
 class AudioModule:
-    """Base class for all audio modules with support for multiple I/O nodes."""
+    """
+    Base class for all audio modules with support for multiple I/O nodes.
+
+    The base attributes live in __slots__. Subclasses that don't declare
+    their own __slots__ get a __dict__ back for their extra attributes,
+    which is what every module with dynamic state should do.
+    """
+
+    __slots__ = (
+        "input_count", "output_count",
+        "input_nodes", "output_nodes",
+        "input_node", "output_node",
+        "_output_buf", "_can_insert",
+    )
 
     def __init__(self, input_count: int = 1, output_count: int = 1, 
                  input_types: list[str] = None, output_types: list[str] = None,
@@ -26,83 +96,112 @@ class AudioModule:
             input_labels: List of labels for each input (default: all "Audio")
             output_labels: List of labels for each output (default: all "Audio")
         """
-        self.input_count = max(0, input_count)
-        self.output_count = max(0, output_count)
-
-        # Default all nodes to "audio" type if not specified
-        if input_types is None:
-            input_types = ["audio"] * self.input_count
-        if output_types is None:
-            output_types = ["audio"] * self.output_count
-        
-        # Default colors and positions to None
-        if input_colors is None:
-            input_colors = [None] * self.input_count
-        if output_colors is None:
-            output_colors = [None] * self.output_count
-        if input_positions is None:
-            input_positions = [None] * self.input_count
-        if output_positions is None:
-            output_positions = [None] * self.output_count
-        
-        # Default labels to "Audio"
-        if input_labels is None:
-            input_labels = ["Audio"] * self.input_count
-        if output_labels is None:
-            output_labels = ["Audio"] * self.output_count
-
-        # Validate list lengths
-        if len(input_types) != self.input_count:
-            raise ValueError(f"input_types length ({len(input_types)}) must match input_count ({self.input_count})")
-        if len(output_types) != self.output_count:
-            raise ValueError(f"output_types length ({len(output_types)}) must match output_count ({self.output_count})")
-        if len(input_colors) != self.input_count:
-            raise ValueError(f"input_colors length ({len(input_colors)}) must match input_count ({self.input_count})")
-        if len(output_colors) != self.output_count:
-            raise ValueError(f"output_colors length ({len(output_colors)}) must match output_count ({self.output_count})")
-        if len(input_positions) != self.input_count:
-            raise ValueError(f"input_positions length ({len(input_positions)}) must match input_count ({self.input_count})")
-        if len(output_positions) != self.output_count:
-            raise ValueError(f"output_positions length ({len(output_positions)}) must match output_count ({self.output_count})")
-        if len(input_labels) != self.input_count:
-            raise ValueError(f"input_labels length ({len(input_labels)}) must match input_count ({self.input_count})")
-        if len(output_labels) != self.output_count:
-            raise ValueError(f"output_labels length ({len(output_labels)}) must match output_count ({self.output_count})")
+        # Set first so destroy() is safe even if validation below raises
+        self.input_nodes = self.output_nodes = ()
+
+        self.input_count = input_count if input_count > 0 else 0
+        self.output_count = output_count if output_count > 0 else 0
+
+        # Fill in defaults ("audio" type, no color/position, "Audio" label)
+        # and validate list lengths
+        n_in, n_out = self.input_count, self.output_count
+        input_types, input_colors, input_positions, input_labels = (
+            _resolve(name, value, default, n_in) for name, value, default in (
+                ("input_types", input_types, "audio"),
+                ("input_colors", input_colors, None),
+                ("input_positions", input_positions, None),
+                ("input_labels", input_labels, "Audio"),
+            )
+        )
+        output_types, output_colors, output_positions, output_labels = (
+            _resolve(name, value, default, n_out) for name, value, default in (
+                ("output_types", output_types, "audio"),
+                ("output_colors", output_colors, None),
+                ("output_positions", output_positions, None),
+                ("output_labels", output_labels, "Audio"),
+            )
+        )
 
         # Create lists of input/output nodes with specified types, colors, positions, and labels
         self.input_nodes: list[Node] = [
-            Node(self, is_input=True, data_type=input_types[i], 
-                 color=input_colors[i], position=input_positions[i], label=input_labels[i]) 
-            for i in range(self.input_count)
+            Node(self, is_input=True, data_type=data_type,
+                 color=color, position=position, label=label)
+            for data_type, color, position, label
+            in zip(input_types, input_colors, input_positions, input_labels)
         ]
         self.output_nodes: list[Node] = [
-            Node(self, is_input=False, data_type=output_types[i],
-                 color=output_colors[i], position=output_positions[i], label=output_labels[i]) 
-            for i in range(self.output_count)
+            Node(self, is_input=False, data_type=data_type,
+                 color=color, position=position, label=label)
+            for data_type, color, position, label
+            in zip(output_types, output_colors, output_positions, output_labels)
         ]
 
         # Backward compatibility for modules assuming single node
         self.input_node = self.input_nodes[0] if self.input_nodes else None
         self.output_node = self.output_nodes[0] if self.output_nodes else None
 
+        # Only modules with both an input and an output can be spliced into a connection
+        self._can_insert = self.input_count > 0 and self.output_count > 0
+
+        # Reusable output block (see _get_output_buffer)
+        self._output_buf: np.ndarray | None = None
+
     def destroy(self):
         """Disconnect and clean up all nodes."""
-        for node in getattr(self, "input_nodes", []):
-            try:
-                node.disconnect()
-            except Exception:
-                pass
-        for node in getattr(self, "output_nodes", []):
-            try:
-                node.disconnect()
-            except Exception:
-                pass
+        for node in chain(self.input_nodes, self.output_nodes):
+            node.disconnect()
 
     def generate(self, frames: int) -> np.ndarray:
-        """Override in child classes to produce audio."""
-        return np.zeros((frames, 2), dtype=np.float32)
+        """
+        Override in child classes to produce audio.
+
+        Gain staging: modules return their raw signal. Output level and
+        clipping are applied once, downstream, by the Endpoint fader and the
+        master mix, so generators should not scale or clip for the mixer.
+
+        Audio blocks are C-contiguous float32 arrays of shape (frames, 2).
+
+        Runs on the audio worker thread, so it must not touch widgets or
+        emit Qt signals; queue values for the UI thread to pick up instead
+        (see Endpoint.drain_levels).
+
+        The default returns a read-only silence block shared by every
+        module; callers must not write to it.
+        """
+        return silence(frames)
+
+    def prepare(self, frames: int):
+        """
+        Called by the engine with its block size before the module is first
+        pulled, so block-sized buffers are allocated up front instead of on
+        the audio thread. Child classes that size their own state (tables,
+        windows, filter buffers) can override this and call super().
+        Modules that use _get_output_buffer should warm it here themselves.
+        """
+        silence(frames)
 
-    def get_ui(self) -> QWidget | None:
+    def _get_output_buffer(self, frames: int) -> np.ndarray:
+        """
+        Return this module's writable (frames, 2) output buffer, zeroed.
+        The same memory is handed out on every call, so it is only valid
+        until the module's next generate().
+        """
+        if audio_buffer_pool.USE_POOL:
+            # Hand the previous block back and take an exact-size one
+            if self._output_buf is not None:
+                audio_buffer_pool.pool.release(self._output_buf)
+            buf = self._output_buf = audio_buffer_pool.pool.acquire(frames)
+            buf.fill(0.0)
+            return buf
+
+        if self._output_buf is None or self._output_buf.shape[0] < frames:
+            self._output_buf = np.zeros((max(frames, 1024), 2), dtype=np.float32)
+            return self._output_buf[:frames]
+        buf = self._output_buf[:frames]
+        buf.fill(0.0)
+        return buf
+
+    def get_ui(self) -> 'QWidget | None':
         """
         Returns a QWidget representing the module's custom UI.
         By default, modules have no UI.
@@ -114,7 +213,7 @@ class AudioModule:
     def insert(self, input_node: Node, output_node: Node):
         """Insert this module between two connected nodes."""
         # Enforce I/O requirements
-        if self.input_count == 0 or self.output_count == 0:
+        if not self._can_insert:
             raise Exception("Module must have at least 1 input and 1 output to insert")
 
         # Validate node types
@@ -131,17 +230,20 @@ class AudioModule:
         Return a dict representation of this module's state.
         Child modules should call super().serialize() and update the dict with their parameters.
         """
+        # One pass per side: (types, colors, positions, labels)
+        in_types, in_colors, in_positions, in_labels = _node_columns(self.input_nodes)
+        out_types, out_colors, out_positions, out_labels = _node_columns(self.output_nodes)
         return {
             "input_count": self.input_count,
             "output_count": self.output_count,
-            "input_types": [node.data_type for node in self.input_nodes],
-            "output_types": [node.data_type for node in self.output_nodes],
-            "input_colors": [node.color for node in self.input_nodes],
-            "output_colors": [node.color for node in self.output_nodes],
-            "input_positions": [node.position for node in self.input_nodes],
-            "output_positions": [node.position for node in self.output_nodes],
-            "input_labels": [node.label for node in self.input_nodes],
-            "output_labels": [node.label for node in self.output_nodes],
+            "input_types": in_types,
+            "output_types": out_types,
+            "input_colors": in_colors,
+            "output_colors": out_colors,
+            "input_positions": in_positions,
+            "output_positions": out_positions,
+            "input_labels": in_labels,
+            "output_labels": out_labels,
         }
 
     def deserialize(self, state: dict):
@@ -151,42 +253,51 @@ class AudioModule:
         """
         self.input_count = state.get("input_count", 1)
         self.output_count = state.get("output_count", 1)
-        input_types = state.get("input_types", ["audio"] * self.input_count)
-        output_types = state.get("output_types", ["audio"] * self.output_count)
-        input_colors = state.get("input_colors", [None] * self.input_count)
-        output_colors = state.get("output_colors", [None] * self.output_count)
-        input_positions = state.get("input_positions", [None] * self.input_count)
-        output_positions = state.get("output_positions", [None] * self.output_count)
-        input_labels = state.get("input_labels", ["Audio"] * self.input_count)
-        output_labels = state.get("output_labels", ["Audio"] * self.output_count)
-
-        # Recreate nodes if counts changed
+        self._can_insert = self.input_count > 0 and self.output_count > 0
+        n_in, n_out = self.input_count, self.output_count
+        input_types = state.get("input_types") or _make_default("audio", n_in)
+        output_types = state.get("output_types") or _make_default("audio", n_out)
+        input_colors = state.get("input_colors") or _make_default(None, n_in)
+        output_colors = state.get("output_colors") or _make_default(None, n_out)
+        input_positions = state.get("input_positions") or _make_default(None, n_in)
+        output_positions = state.get("output_positions") or _make_default(None, n_out)
+        input_labels = state.get("input_labels") or _make_default("Audio", n_in)
+        output_labels = state.get("output_labels") or _make_default("Audio", n_out)
+
+        # Add any missing nodes in one comprehension per side (existing nodes
+        # keep their connections), then drop extras if the count decreased
+        def padded(values, default, count):
+            return values if len(values) >= count else list(values) + [default] * (count - len(values))
+
         current_inputs = len(self.input_nodes)
-        current_outputs = len(self.output_nodes)
+        if self.input_count > current_inputs:
+            self.input_nodes += [
+                Node(self, is_input=True, data_type=data_type,
+                     color=color, position=position, label=label)
+                for data_type, color, position, label in zip(
+                    padded(input_types, "audio", n_in)[current_inputs:n_in],
+                    padded(input_colors, None, n_in)[current_inputs:n_in],
+                    padded(input_positions, None, n_in)[current_inputs:n_in],
+                    padded(input_labels, "Audio", n_in)[current_inputs:n_in],
+                )
+            ]
+        else:
+            self.input_nodes = self.input_nodes[:n_in]
 
-        # Add missing input nodes
-        for i in range(self.input_count - current_inputs):
-            idx = current_inputs + i
-            data_type = input_types[idx] if idx < len(input_types) else "audio"
-            color = input_colors[idx] if idx < len(input_colors) else None
-            position = input_positions[idx] if idx < len(input_positions) else None
-            label = input_labels[idx] if idx < len(input_labels) else "Audio"
-            self.input_nodes.append(Node(self, is_input=True, data_type=data_type,
-                                        color=color, position=position, label=label))
-
-        # Add missing output nodes
-        for i in range(self.output_count - current_outputs):
-            idx = current_outputs + i
-            data_type = output_types[idx] if idx < len(output_types) else "audio"
-            color = output_colors[idx] if idx < len(output_colors) else None
-            position = output_positions[idx] if idx < len(output_positions) else None
-            label = output_labels[idx] if idx < len(output_labels) else "Audio"
-            self.output_nodes.append(Node(self, is_input=False, data_type=data_type,
-                                         color=color, position=position, label=label))
-
-        # Remove extra nodes if count decreased
-        self.input_nodes = self.input_nodes[:self.input_count]
-        self.output_nodes = self.output_nodes[:self.output_count]
+        current_outputs = len(self.output_nodes)
+        if self.output_count > current_outputs:
+            self.output_nodes += [
+                Node(self, is_input=False, data_type=data_type,
+                     color=color, position=position, label=label)
+                for data_type, color, position, label in zip(
+                    padded(output_types, "audio", n_out)[current_outputs:n_out],
+                    padded(output_colors, None, n_out)[current_outputs:n_out],
+                    padded(output_positions, None, n_out)[current_outputs:n_out],
+                    padded(output_labels, "Audio", n_out)[current_outputs:n_out],
+                )
+            ]
+        else:
+            self.output_nodes = self.output_nodes[:n_out]
 
         # Update single-node references
         self.input_node = self.input_nodes[0] if self.input_nodes else None
@@ -9,113 +9,257 @@ Features:
 - Load or Add layout options
 """
 
+import heapq
 import os
+import time
+from collections import deque
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton,
     QScrollArea, QFrame, QLabel, QGraphicsDropShadowEffect,
-    QApplication, QMenu
+    QApplication, QMenu, QListView, QAbstractItemView, QStyledItemDelegate, QStyle
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QPoint
-from PyQt6.QtGui import QColor, QCursor, QAction
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QPoint, QTimer, QObject, QRunnable, QThreadPool, QMutex, QMutexLocker,
+    QAbstractListModel, QSortFilterProxyModel, QModelIndex, QSize, QRectF
+)
+from PyQt6.QtGui import QColor, QCursor, QAction, QPainter, QPen, QFont
+
+from typing import Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+
 
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+UNCATEGORIZED = ("Uncategorized",)
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def category_display(category: Tuple[str, ...]) -> str:
+    """Display string for a category path, e.g. ("Tests", "Bass") -> "Tests/Bass"."""
+    return "/".join(category)
+
+
+@dataclass(frozen=True, slots=True)
 class LayoutInfo:
     """Metadata about a discovered layout file."""
     name: str           # Display name (filename without extension)
     file_path: Path     # Full path to the .layout file
-    category: str       # Category based on folder structure
+    category: Tuple[str, ...]  # Category path based on folder structure, shared by siblings
+    name_lower: str = field(init=False, repr=False, compare=False)  # Lowercased name for sorting/search
+    display_name: str = field(init=False, repr=False, compare=False)  # Formatted name for labels
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'name_lower', self.name.lower())
+        object.__setattr__(self, 'display_name', self.name.replace('_', ' ').replace('-', ' '))
     
     def get_display_name(self) -> str:
         """Get a formatted display name."""
-        return self.name.replace('_', ' ').replace('-', ' ')
+        return self.display_name
 
 
 class LayoutScanner:
     """Scans a directory for .layout files and organizes by folder structure."""
     
+    # Directory mtimes can be as coarse as 2 s (FAT). A listing taken that
+    # close to the last change may have missed an edit made in the same
+    # tick, so its mtime is not trusted and the next scan re-lists.
+    RACY_WINDOW_NS = 2_000_000_000
+    
     def __init__(self, layouts_dir: str = "layouts"):
         self.layouts_dir = Path(layouts_dir)
         self.layouts: Dict[str, LayoutInfo] = {}
+        self._by_category: Dict[Tuple[str, ...], List[LayoutInfo]] = {}  # each list sorted by name
+        # (layouts, trigram index) swapped as one reference, so a search on a
+        # worker thread never pairs a new index with old layouts
+        self._search_index: Tuple[Dict[str, LayoutInfo], Dict[str, Set[str]]] = ({}, {})
         self._scanned = False
         
+        # Per-directory listing cache keyed by directory path, kept in memory
+        # for this scanner's lifetime. A directory's mtime only changes when
+        # entries are added, removed or renamed in it, so an unchanged mtime
+        # means its cached listing is still valid and a warm rescan costs
+        # one stat() per directory.
+        self._dir_mtimes: Dict[str, Optional[int]] = {}  # None: re-list next scan
+        self._dir_entries: Dict[str, List[tuple]] = {}  # path -> [(name, is_dir), ...]
+        self._mutex = QMutex()
+        
     def scan(self, force: bool = False) -> Dict[str, LayoutInfo]:
         """Scan the layouts directory for .layout files."""
         if self._scanned and not force:
             return self.layouts
             
-        self.layouts.clear()
-        
-        if not self.layouts_dir.exists():
-            return self.layouts
-            
-        self._scan_directory(self.layouts_dir, [])
+        self.set_layouts(self.collect())
+        return self.layouts
+    
+    def set_layouts(self, layouts: Dict[str, LayoutInfo]):
+        """Install the result of collect() as the current layout set."""
+        # Group once here rather than filtering every layout per category on
+        # each rebuild. Built from the final dict so a name that appears in
+        # several folders is listed only where it won.
+        by_category: Dict[Tuple[str, ...], List[LayoutInfo]] = {}
+        for info in layouts.values():
+            by_category.setdefault(info.category, []).append(info)
+        for bucket in by_category.values():
+            bucket.sort(key=lambda x: x.name_lower)
+        
+        trigram_index: Dict[str, Set[str]] = {}
+        for name, info in layouts.items():
+            lowered = info.name_lower
+            for i in range(len(lowered) - 2):
+                trigram_index.setdefault(lowered[i:i + 3], set()).add(name)
+        
+        self.layouts = layouts
+        self._by_category = by_category
+        self._search_index = (layouts, trigram_index)  # trigram -> layout names
         self._scanned = True
+    
+    def collect(self) -> Dict[str, LayoutInfo]:
+        """
+        Walk the layouts directory and return a fresh name -> LayoutInfo dict.
+        
+        Does not touch self.layouts, so it can run on a worker thread while
+        the UI keeps reading the previous result; the caller swaps it in.
+        """
+        layouts: Dict[str, LayoutInfo] = {}
+        
+        # The directory index is shared by every scan, so overlapping
+        # refreshes must not walk it concurrently
+        with QMutexLocker(self._mutex):
+            if not self.layouts_dir.exists():
+                return layouts
+                
+            seen = set()
+            self._scan_all(seen, layouts)
+            
+            # Drop directories that no longer exist (their parent's mtime
+            # bumped, so the parent was re-listed and they were never visited)
+            for key in self._dir_mtimes.keys() - seen:
+                del self._dir_mtimes[key]
+                self._dir_entries.pop(key, None)
         
-        return self.layouts
+        return layouts
+    
+    def _scan_all(self, seen: set, layouts: Dict[str, LayoutInfo]):
+        """Walk the layouts tree iteratively, registering every layout file."""
+        # Explicit LIFO stack of (path, category_parts, is_dir). Entries are
+        # pushed in reverse so they pop in sorted order, which keeps the
+        # depth-first visiting order (and so which duplicate name wins) of
+        # a recursive walk without a Python frame per level.
+        stack = deque([(self.layouts_dir, (), True)])
+        visited = set()  # (st_dev, st_ino) of every directory walked
+        while stack:
+            path, category_parts, is_dir = stack.pop()
+            if not is_dir:
+                self._register_layout(layouts, path, category_parts)
+                continue
+                
+            entries = self._cached_listing(path, seen, visited)
+            if entries is None:
+                continue
+            for name, entry_is_dir in reversed(entries):
+                if entry_is_dir:
+                    parts = category_parts + (self._format_category_name(name),)
+                    stack.append((path / name, parts, True))
+                else:
+                    stack.append((path / name, category_parts, False))
     
-    def _scan_directory(self, directory: Path, category_parts: List[str]):
-        """Recursively scan a directory for layout files."""
+    def _cached_listing(self, directory: Path, seen: set,
+                        visited: set) -> Optional[List[tuple]]:
+        """Return the directory's (name, is_dir) listing, re-listing only if its mtime moved."""
+        key = os.path.abspath(directory)
         try:
-            entries = sorted(directory.iterdir())
+            st = os.stat(directory)
+        except OSError:
+            return None
+        # Symlinked folders are followed, so a link back up the tree would
+        # otherwise be walked forever
+        identity = (st.st_dev, st.st_ino)
+        if identity in visited:
+            return None
+        visited.add(identity)
+        mtime = st.st_mtime_ns
+        seen.add(key)
+        
+        entries = self._dir_entries.get(key)
+        if entries is None or self._dir_mtimes.get(key) != mtime:
+            entries = self._list_directory(directory)
+            if entries is None:
+                return None
+            racy = time.time_ns() - mtime <= self.RACY_WINDOW_NS
+            self._dir_mtimes[key] = None if racy else mtime
+            self._dir_entries[key] = entries
+        return entries
+    
+    def _list_directory(self, directory: Path) -> Optional[List[tuple]]:
+        """List subdirectories and .layout files as sorted (name, is_dir) pairs."""
+        # os.scandir exposes the d_type from readdir, so is_dir() needs no
+        # extra stat() per plain entry the way Path.iterdir() + Path.is_dir()
+        # does; symlinks are still followed like Path.is_dir()
+        try:
+            with os.scandir(directory) as it:
+                entries = [entry for entry in it if not entry.name.startswith('.')]
         except PermissionError:
-            return
-            
+            return None
+        entries.sort(key=lambda entry: entry.name)
+        
+        listing = []
         for entry in entries:
-            # Skip hidden files and directories
-            if entry.name.startswith('.'):
-                continue
-                
             if entry.is_dir():
-                # Recurse into subdirectory
-                new_category = category_parts + [self._format_category_name(entry.name)]
-                self._scan_directory(entry, new_category)
-                
-            elif entry.suffix == '.layout':
-                self._register_layout(entry, category_parts)
+                listing.append((entry.name, True))
+            elif entry.name.endswith('.layout'):
+                listing.append((entry.name, False))
+        return listing
     
     def _format_category_name(self, folder_name: str) -> str:
         """Convert folder name to display category name."""
         name = folder_name.replace('_', ' ').replace('-', ' ')
         return name.title()
     
-    def _register_layout(self, file_path: Path, category_parts: List[str]):
+    def _register_layout(self, layouts: Dict[str, LayoutInfo], file_path: Path,
+                         category_parts: Tuple[str, ...]):
         """Register a discovered layout file."""
         name = file_path.stem  # Filename without extension
-        category = "/".join(category_parts) if category_parts else "Uncategorized"
         
+        # Every layout in a folder shares its parent's category tuple, so
+        # the path is stored once per folder rather than joined per file
         info = LayoutInfo(
             name=name,
             file_path=file_path,
-            category=category
+            category=category_parts or UNCATEGORIZED
         )
         
-        self.layouts[name] = info
+        layouts[name] = info
     
-    def get_categories(self) -> List[str]:
-        """Get list of all unique categories."""
-        categories = set()
-        for info in self.layouts.values():
-            categories.add(info.category)
-        return sorted(categories)
+    def get_categories(self) -> List[Tuple[str, ...]]:
+        """Get list of all unique categories, ordered by display name."""
+        return sorted(self._by_category, key=category_display)
     
-    def get_layouts_in_category(self, category: str) -> List[LayoutInfo]:
-        """Get all layouts in a specific category."""
-        return sorted(
-            [info for info in self.layouts.values() if info.category == category],
-            key=lambda x: x.name.lower()
-        )
+    def get_layouts_in_category(self, category: Tuple[str, ...]) -> List[LayoutInfo]:
+        """Get all layouts in a specific category, sorted by name. Do not modify the list."""
+        return self._by_category.get(category, [])
     
     def search(self, query: str) -> List[LayoutInfo]:
         """Search layouts by name."""
         query_lower = query.lower()
+        layouts, trigram_index = self._search_index
+        if len(query_lower) < 3:
+            candidates = layouts.values()
+        else:
+            # Every name containing the query contains all of its trigrams,
+            # so intersecting their posting lists gives a short superset
+            postings = []
+            for i in range(len(query_lower) - 2):
+                posting = trigram_index.get(query_lower[i:i + 3])
+                if not posting:
+                    return []
+                postings.append(posting)
+            postings.sort(key=len)
+            names = postings[0].intersection(*postings[1:])
+            candidates = [layouts[name] for name in names]
+        # Tie-break on the exact name: set order is arbitrary
         return sorted(
-            [info for info in self.layouts.values() if query_lower in info.name.lower()],
-            key=lambda x: x.name.lower()
+            [info for info in candidates if query_lower in info.name_lower],
+            key=lambda x: (x.name_lower, x.name)
         )
     
     def get_layout(self, name: str) -> Optional[LayoutInfo]:
@@ -123,6 +267,136 @@ class LayoutScanner:
         return self.layouts.get(name)
 
 
+class _ScanSignals(QObject):
+    """Signals for ScanWorker (QRunnable is not a QObject)."""
+    finished = pyqtSignal(int, object)  # generation, name -> LayoutInfo dict
+
+
+class ScanWorker(QRunnable):
+    """Runs LayoutScanner.collect() on a QThreadPool thread."""
+    
+    def __init__(self, scanner: LayoutScanner, generation: int):
+        super().__init__()
+        self.scanner = scanner
+        self.generation = generation
+        self.signals = _ScanSignals()
+        
+    def run(self):
+        try:
+            layouts = self.scanner.collect()
+        except Exception:
+            layouts = {}
+        # Queued to the UI thread, where the receiving browser lives
+        self.signals.finished.emit(self.generation, layouts)
+
+
+class _FilterSignals(QObject):
+    """Signals for FilterWorker."""
+    finished = pyqtSignal(int, str, object)  # generation, query, set of matching names
+
+
+class FilterWorker(QRunnable):
+    """Runs LayoutScanner.search() for one query on a QThreadPool thread."""
+    
+    def __init__(self, scanner: LayoutScanner, query: str, generation: int):
+        super().__init__()
+        self.scanner = scanner
+        self.query = query
+        self.generation = generation
+        self.signals = _FilterSignals()
+        
+    def run(self):
+        try:
+            names = {info.name for info in self.scanner.search(self.query)}
+        except Exception:
+            names = set()
+        self.signals.finished.emit(self.generation, self.query, names)
+
+
+def _exec_layout_menu(parent: QWidget, global_pos: QPoint, is_favorite: bool) -> Optional[str]:
+    """
+    Show the Add / Load / Favorite context menu for a layout.
+    
+    Returns "add", "load", "favorite" or None if dismissed.
+    """
+    menu = QMenu(parent)
+    menu.setStyleSheet("""
+        QMenu {
+            background-color: rgba(40, 40, 45, 0.98);
+            border: 1px solid rgba(70, 70, 75, 0.8);
+            border-radius: 6px;
+            padding: 4px;
+        }
+        QMenu::item {
+            padding: 6px 16px;
+            color: #e0e0e0;
+            border-radius: 4px;
+            margin: 2px 4px;
+        }
+        QMenu::item:selected {
+            background-color: rgba(80, 80, 85, 0.9);
+        }
+    """)
+    
+    # Add action (default)
+    add_action = QAction("Add to Current", menu)
+    menu.addAction(add_action)
+    
+    # Load action
+    load_action = QAction("Load (Replace)", menu)
+    menu.addAction(load_action)
+    
+    menu.addSeparator()
+    
+    # Favorite toggle
+    fav_text = "Remove from Favorites" if is_favorite else "Add to Favorites"
+    fav_action = QAction(fav_text, menu)
+    menu.addAction(fav_action)
+    
+    chosen = menu.exec(global_pos)
+    if chosen is add_action:
+        return "add"
+    if chosen is load_action:
+        return "load"
+    if chosen is fav_action:
+        return "favorite"
+    return None
+
+
+# Shared by every LayoutButton; installed once on the browser container
+LAYOUT_BUTTON_STYLE = """
+    QPushButton[layoutBtn="true"] {
+        background-color: rgba(55, 65, 60, 0.9);
+        color: #e0e0e0;
+        border: 1px solid rgba(100, 100, 105, 0.5);
+        border-radius: 6px;
+        padding: 6px 12px;
+        font-size: 12px;
+        font-weight: 500;
+        text-align: left;
+        min-height: 26px;
+    }
+    QPushButton[layoutBtn="true"][compact="true"] {
+        padding: 5px 10px;
+        min-height: 24px;
+    }
+    QPushButton[layoutBtn="true"][fav="true"] {
+        background-color: rgba(70, 60, 45, 0.9);
+    }
+    QPushButton[layoutBtn="true"]:hover {
+        background-color: rgba(75, 85, 80, 0.95);
+        border-color: rgba(140, 140, 145, 0.7);
+    }
+    QPushButton[layoutBtn="true"][fav="true"]:hover {
+        background-color: rgba(90, 75, 50, 0.95);
+    }
+    QPushButton[layoutBtn="true"]:pressed,
+    QPushButton[layoutBtn="true"][fav="true"]:pressed {
+        background-color: rgba(50, 50, 55, 0.95);
+    }
+"""
+
+
 class LayoutButton(QPushButton):
     """A styled button representing a layout in the browser."""
     
@@ -137,101 +411,58 @@ class LayoutButton(QPushButton):
         self._is_favorite = is_favorite
         self._compact = compact
         
-        self.setText(layout_info.get_display_name())
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self._on_context_menu)
         
-        self._apply_style()
+        # Styled by LAYOUT_BUTTON_STYLE on the browser container, keyed on
+        # these dynamic properties, so no per-button stylesheet is parsed
+        self.setProperty("layoutBtn", True)
+        self.setProperty("compact", compact)
+        self.setProperty("fav", is_favorite)
+        self._update_text()
         
-    def _apply_style(self):
-        """Apply visual styling based on state."""
-        if self._compact:
-            padding = "5px 10px"
-            font_size = "12px"
-            min_height = "24px"
-            border_radius = "6px"
-        else:
-            padding = "6px 12px"
-            font_size = "12px"
-            min_height = "26px"
-            border_radius = "6px"
-        
-        favorite_indicator = "[*] " if self._is_favorite else ""
+    def _update_text(self):
+        """Set the label, with a favorite marker on full-size buttons."""
         if self._is_favorite and not self._compact:
-            self.setText(f"{favorite_indicator}{self.layout_info.get_display_name()}")
+            self.setText(f"[*] {self.layout_info.display_name}")
         else:
-            self.setText(self.layout_info.get_display_name())
-        
-        base_bg = "rgba(55, 65, 60, 0.9)" if not self._is_favorite else "rgba(70, 60, 45, 0.9)"
-        hover_bg = "rgba(75, 85, 80, 0.95)" if not self._is_favorite else "rgba(90, 75, 50, 0.95)"
+            self.setText(self.layout_info.display_name)
         
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {base_bg};
-                color: #e0e0e0;
-                border: 1px solid rgba(100, 100, 105, 0.5);
-                border-radius: {border_radius};
-                padding: {padding};
-                font-size: {font_size};
-                font-weight: 500;
-                text-align: left;
-                min-height: {min_height};
-            }}
-            QPushButton:hover {{
-                background-color: {hover_bg};
-                border-color: rgba(140, 140, 145, 0.7);
-            }}
-            QPushButton:pressed {{
-                background-color: rgba(50, 50, 55, 0.95);
-            }}
-        """)
+    def _apply_style(self):
+        """Re-evaluate the shared stylesheet after the fav property changed."""
+        self.setProperty("fav", self._is_favorite)
+        self._update_text()
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
         
     def set_favorite(self, is_favorite: bool):
         """Update favorite status and restyle."""
         self._is_favorite = is_favorite
         self._apply_style()
         
+    def rebind(self, layout_info: LayoutInfo, is_favorite: bool, compact: bool):
+        """Point a pooled button at another layout, re-polishing only if its style state changed."""
+        restyle = is_favorite != self._is_favorite or compact != self._compact
+        self.layout_info = layout_info
+        self._is_favorite = is_favorite
+        self._compact = compact
+        if restyle:
+            self.setProperty("compact", compact)
+            self._apply_style()
+        else:
+            self._update_text()
+        
     def _on_context_menu(self, pos):
         """Handle right-click context menu."""
-        menu = QMenu(self)
-        menu.setStyleSheet("""
-            QMenu {
-                background-color: rgba(40, 40, 45, 0.98);
-                border: 1px solid rgba(70, 70, 75, 0.8);
-                border-radius: 6px;
-                padding: 4px;
-            }
-            QMenu::item {
-                padding: 6px 16px;
-                color: #e0e0e0;
-                border-radius: 4px;
-                margin: 2px 4px;
-            }
-            QMenu::item:selected {
-                background-color: rgba(80, 80, 85, 0.9);
-            }
-        """)
-        
-        # Add action (default)
-        add_action = QAction("Add to Current", self)
-        add_action.triggered.connect(lambda: self.addRequested.emit(self.layout_info.name))
-        menu.addAction(add_action)
-        
-        # Load action
-        load_action = QAction("Load (Replace)", self)
-        load_action.triggered.connect(lambda: self.loadRequested.emit(self.layout_info.name))
-        menu.addAction(load_action)
-        
-        menu.addSeparator()
-        
-        # Favorite toggle
-        fav_text = "Remove from Favorites" if self._is_favorite else "Add to Favorites"
-        fav_action = QAction(fav_text, self)
-        fav_action.triggered.connect(self._toggle_favorite)
-        menu.addAction(fav_action)
-        
-        menu.exec(self.mapToGlobal(pos))
+        choice = _exec_layout_menu(self, self.mapToGlobal(pos), self._is_favorite)
+        if choice == "add":
+            self.addRequested.emit(self.layout_info.name)
+        elif choice == "load":
+            self.loadRequested.emit(self.layout_info.name)
+        elif choice == "favorite":
+            self._toggle_favorite()
         
     def _toggle_favorite(self):
         """Toggle favorite status."""
@@ -255,6 +486,7 @@ class LayoutQuickAccessBar(QWidget):
         self._layout.setSpacing(6)
         
         self._buttons: Dict[str, LayoutButton] = {}
+        self._button_pool: List[LayoutButton] = []  # detached buttons kept for reuse
         self._layout_scanner = None
         
         # Favorites section
@@ -323,11 +555,41 @@ class LayoutQuickAccessBar(QWidget):
         """Set the layout scanner for lookups."""
         self._layout_scanner = scanner
         
+    def _acquire_button(self, info: LayoutInfo, is_favorite: bool) -> LayoutButton:
+        """Take a button from the pool (or create one) and bind it to a layout."""
+        if self._button_pool:
+            btn = self._button_pool.pop()
+            btn.rebind(info, is_favorite, compact=True)
+            return btn
+            
+        btn = LayoutButton(info, is_favorite=is_favorite, compact=True)
+        # One shared slot and direct signal-to-signal forwards: no closure
+        # per button, and the name is read at emit time so pooling is safe
+        btn.clicked.connect(self._emit_click)
+        btn.favoriteToggled.connect(self.favoriteToggled)
+        btn.loadRequested.connect(self.loadRequested)
+        btn.addRequested.connect(self.addRequested)
+        return btn
+        
+    def _emit_click(self):
+        """Forward a button click as layoutClicked(name)."""
+        self.layoutClicked.emit(self.sender().layout_info.name)
+        
     def update_layouts(self, favorites: List[str], history: List[str]):
         """Update the quick access sections."""
-        # Clear existing buttons
+        # Suspend painting so the whole update costs one relayout + repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self._update_layouts(favorites, history)
+        finally:
+            self.setUpdatesEnabled(True)
+            
+    def _update_layouts(self, favorites: List[str], history: List[str]):
+        # Detach existing buttons into the pool instead of deleting them
         for btn in self._buttons.values():
-            btn.deleteLater()
+            btn.hide()
+            btn.parentWidget().layout().removeWidget(btn)
+            self._button_pool.append(btn)
         self._buttons.clear()
         
         if not self._layout_scanner:
@@ -344,16 +606,14 @@ class LayoutQuickAccessBar(QWidget):
         for name in valid_favorites:
             info = self._layout_scanner.get_layout(name)
             if info:
-                btn = LayoutButton(info, is_favorite=True, compact=True)
-                btn.clicked.connect(lambda checked, n=name: self.layoutClicked.emit(n))
-                btn.favoriteToggled.connect(self.favoriteToggled.emit)
-                btn.loadRequested.connect(self.loadRequested.emit)
-                btn.addRequested.connect(self.addRequested.emit)
+                btn = self._acquire_button(info, is_favorite=True)
                 self._buttons[f"fav_{name}"] = btn
                 self._favorites_layout.insertWidget(self._favorites_layout.count() - 1, btn)
+                btn.show()
         
         # Update history section (exclude favorites)
-        history_filtered = [h for h in history if h not in favorites][:6]
+        fav_set = frozenset(favorites)
+        history_filtered = [h for h in history if h not in fav_set][:6]
         valid_history = []
         for name in history_filtered:
             info = self._layout_scanner.get_layout(name)
@@ -364,13 +624,141 @@ class LayoutQuickAccessBar(QWidget):
         for name in valid_history:
             info = self._layout_scanner.get_layout(name)
             if info:
-                btn = LayoutButton(info, is_favorite=False, compact=True)
-                btn.clicked.connect(lambda checked, n=name: self.layoutClicked.emit(n))
-                btn.favoriteToggled.connect(self.favoriteToggled.emit)
-                btn.loadRequested.connect(self.loadRequested.emit)
-                btn.addRequested.connect(self.addRequested.emit)
+                btn = self._acquire_button(info, is_favorite=False)
                 self._buttons[f"hist_{name}"] = btn
                 self._history_layout.insertWidget(self._history_layout.count() - 1, btn)
+                btn.show()
+
+
+# Custom item data roles for LayoutListModel
+LAYOUT_INFO_ROLE = Qt.ItemDataRole.UserRole
+FAVORITE_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+class LayoutListModel(QAbstractListModel):
+    """Flat list model of the layouts in one category."""
+    
+    def __init__(self, layouts: List[LayoutInfo], favorites: Set[str], parent=None):
+        super().__init__(parent)
+        self._layouts = layouts
+        self._favorites = favorites
+        
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._layouts)
+    
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        info = self._layouts[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            if info.name in self._favorites:
+                return f"[*] {info.display_name}"
+            return info.display_name
+        if role == LAYOUT_INFO_ROLE:
+            return info
+        if role == FAVORITE_ROLE:
+            return info.name in self._favorites
+        return None
+    
+    def set_favorites(self, favorites: Set[str]):
+        """Replace the favorites set and repaint every row."""
+        self._favorites = favorites
+        if self._layouts:
+            self.dataChanged.emit(self.index(0), self.index(len(self._layouts) - 1))
+            
+    def set_favorite(self, name: str, is_favorite: bool):
+        """Update one layout's favorite flag and repaint its row."""
+        if is_favorite:
+            self._favorites.add(name)
+        else:
+            self._favorites.discard(name)
+        for row, info in enumerate(self._layouts):
+            if info.name == name:
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+                break
+
+
+class LayoutFilterProxy(QSortFilterProxyModel):
+    """Hides rows that do not match the current search query."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._query_lower = ""
+        self._match_names: Optional[Set[str]] = None
+        
+    def set_filter(self, query: str, match_names: Optional[Set[str]] = None):
+        """Set the query, optionally with the precomputed set of matching names."""
+        self._query_lower = query.lower()
+        self._match_names = match_names
+        self.invalidateFilter()
+        
+    @staticmethod
+    def matches(info: LayoutInfo, query_lower: str, match_names: Optional[Set[str]]) -> bool:
+        """The row predicate, usable without a model."""
+        if not query_lower:
+            return True
+        if match_names is not None:
+            return info.name in match_names
+        return query_lower in info.name_lower
+        
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        info = self.sourceModel().index(source_row, 0, source_parent).data(LAYOUT_INFO_ROLE)
+        return self.matches(info, self._query_lower, self._match_names)
+
+
+class LayoutItemDelegate(QStyledItemDelegate):
+    """Paints a layout row to look like a LayoutButton, without a widget per row."""
+    
+    ROW_HEIGHT = 38
+    
+    _BG = QColor(55, 65, 60, 230)
+    _BG_HOVER = QColor(75, 85, 80, 242)
+    _FAV_BG = QColor(70, 60, 45, 230)
+    _FAV_BG_HOVER = QColor(90, 75, 50, 242)
+    _BORDER = QColor(100, 100, 105, 128)
+    _BORDER_HOVER = QColor(140, 140, 145, 179)
+    _TEXT = QColor(0xe0, 0xe0, 0xe0)
+    _PEN = QPen(_BORDER, 1)
+    _PEN_HOVER = QPen(_BORDER_HOVER, 1)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Only two pens and one font are ever used, so build them once
+        # instead of on every row paint; the font needs a QApplication
+        self._font: Optional[QFont] = None
+    
+    def paint(self, painter: QPainter, option, index: QModelIndex):
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        favorite = index.data(FAVORITE_ROLE)
+        if favorite:
+            bg = self._FAV_BG_HOVER if hovered else self._FAV_BG
+        else:
+            bg = self._BG_HOVER if hovered else self._BG
+            
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        rect = QRectF(option.rect).adjusted(0.5, 0.5, -0.5, -0.5)
+        painter.setPen(self._PEN_HOVER if hovered else self._PEN)
+        painter.setBrush(bg)
+        painter.drawRoundedRect(rect, 6, 6)
+        
+        if self._font is None:
+            self._font = QFont(option.font)
+            self._font.setPixelSize(12)
+            self._font.setWeight(QFont.Weight.Medium)
+        painter.setFont(self._font)
+        painter.setPen(self._TEXT)
+        text_rect = option.rect.adjusted(12, 0, -12, 0)
+        painter.drawText(
+            text_rect,
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            index.data(Qt.ItemDataRole.DisplayRole)
+        )
+        painter.restore()
+        
+    def sizeHint(self, option, index: QModelIndex) -> QSize:
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
 
 
 class LayoutCategorySection(QWidget):
@@ -386,9 +774,9 @@ class LayoutCategorySection(QWidget):
         super().__init__(parent)
         self._category_name = category_name
         self._layouts = layouts
-        self._favorites = favorites
+        self._names = frozenset(info.name for info in layouts)
+        self._favorites = set(favorites)
         self._expanded = False  # Start collapsed
-        self._buttons: List[LayoutButton] = []
         
         self._setup_ui()
         
@@ -421,62 +809,119 @@ class LayoutCategorySection(QWidget):
         self._header.clicked.connect(self._toggle_expanded)
         layout.addWidget(self._header)
         
-        # Content container - starts hidden
-        self._content = QWidget()
-        self._content.setVisible(False)
-        content_layout = QVBoxLayout(self._content)
-        content_layout.setContentsMargins(6, 0, 0, 0)
-        content_layout.setSpacing(2)
+        # The list is built on first expansion (see _populate_content)
+        self._content: Optional[QListView] = None
         
+    def _populate_content(self):
+        """Create the list view and its model; called once, on first expansion."""
         # Sort layouts: favorites first, then alphabetical
         sorted_layouts = sorted(
             self._layouts,
-            key=lambda l: (0 if l.name in self._favorites else 1, l.name.lower())
+            key=lambda l: (0 if l.name in self._favorites else 1, l.name_lower)
         )
         
-        for layout_info in sorted_layouts:
-            is_fav = layout_info.name in self._favorites
-            btn = LayoutButton(layout_info, is_favorite=is_fav)
-            btn.clicked.connect(lambda checked, n=layout_info.name: self.layoutClicked.emit(n))
-            btn.favoriteToggled.connect(self._on_favorite_toggled)
-            btn.loadRequested.connect(self.loadRequested.emit)
-            btn.addRequested.connect(self.addRequested.emit)
-            self._buttons.append(btn)
-            content_layout.addWidget(btn)
+        # One list view for the whole category: rows are painted by the
+        # delegate, so only rows inside the visible region cost anything
+        self._model = LayoutListModel(sorted_layouts, self._favorites, self)
+        self._proxy = LayoutFilterProxy(self)
+        self._proxy.setSourceModel(self._model)
+        
+        self._content = QListView()
+        self._content.setModel(self._proxy)
+        self._content.setItemDelegate(LayoutItemDelegate(self._content))
+        self._content.setUniformItemSizes(True)
+        self._content.setSpacing(1)
+        self._content.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self._content.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self._content.setMouseTracking(True)
+        self._content.viewport().setAttribute(Qt.WidgetAttribute.WA_Hover, True)
+        self._content.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
+        self._content.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self._content.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self._content.setFrameShape(QFrame.Shape.NoFrame)
+        self._content.setStyleSheet("QListView { background: transparent; margin-left: 6px; }")
+        self._content.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self._content.clicked.connect(self._on_item_clicked)
+        self._content.customContextMenuRequested.connect(self._on_context_menu)
+        self._content.setVisible(False)
+        self._fit_content_height()
+        
+        self.layout().addWidget(self._content)
+        
+    def _fit_content_height(self):
+        """Size the list to its visible rows; the browser's scroll area does the scrolling."""
+        rows = self._proxy.rowCount()
+        spacing = self._content.spacing()
+        self._content.setFixedHeight(rows * (LayoutItemDelegate.ROW_HEIGHT + 2 * spacing))
+        
+    def _on_item_clicked(self, index: QModelIndex):
+        """Handle a left click on a layout row."""
+        info = index.data(LAYOUT_INFO_ROLE)
+        if info is not None:
+            self.layoutClicked.emit(info.name)
             
-        layout.addWidget(self._content)
+    def _on_context_menu(self, pos):
+        """Handle right-click context menu on a layout row."""
+        index = self._content.indexAt(pos)
+        if not index.isValid():
+            return
+        name = index.data(LAYOUT_INFO_ROLE).name
+        is_favorite = name in self._favorites
+        
+        choice = _exec_layout_menu(self, self._content.viewport().mapToGlobal(pos), is_favorite)
+        if choice == "add":
+            self.addRequested.emit(name)
+        elif choice == "load":
+            self.loadRequested.emit(name)
+        elif choice == "favorite":
+            self._on_favorite_toggled(name, not is_favorite)
         
     def _on_favorite_toggled(self, name: str, is_favorite: bool):
-        """Handle favorite toggle from a button."""
-        if is_favorite:
-            self._favorites.append(name)
-        elif name in self._favorites:
-            self._favorites.remove(name)
+        """Handle favorite toggle from a row."""
+        self._model.set_favorite(name, is_favorite)
         self.favoriteToggled.emit(name, is_favorite)
         
     def _toggle_expanded(self):
         """Toggle the expanded/collapsed state."""
         self._expanded = not self._expanded
+        if self._content is None:
+            self._populate_content()
         self._content.setVisible(self._expanded)
         arrow = "v" if self._expanded else ">"
         self._header.setText(f"{arrow}  {self._category_name}")
         
     def update_favorites(self, favorites: List[str]):
-        """Update favorite status for all buttons."""
-        self._favorites = favorites
-        for btn in self._buttons:
-            btn.set_favorite(btn.layout_info.name in favorites)
+        """Update favorite status for all rows."""
+        self._favorites = set(favorites)
+        if self._content is not None:
+            self._model.set_favorites(self._favorites)
             
-    def filter_layouts(self, query: str) -> int:
-        """Filter layouts by search query."""
-        query_lower = query.lower()
-        visible_count = 0
-        
-        for btn in self._buttons:
-            matches = query_lower in btn.layout_info.name.lower()
-            btn.setVisible(matches)
-            if matches:
-                visible_count += 1
+    def filter_layouts(self, query: str, match_names: Optional[Set[str]] = None) -> int:
+        """
+        Filter layouts by search query.
+        
+        match_names, when given, is the set of layout names matching the
+        query (see LayoutScanner.search), shared by every section so the
+        substring test runs once per layout rather than once per row.
+        """
+        if self._content is None:
+            # Not built yet: count matches directly and only build the list
+            # if the search is about to expand this section
+            if not query:
+                visible_count = len(self._layouts)
+            elif match_names is not None:
+                # Set intersection runs in C over the smaller of the two sets
+                visible_count = len(self._names & match_names)
+            else:
+                query_lower = query.lower()
+                visible_count = sum(1 for info in self._layouts if query_lower in info.name_lower)
+            if query and visible_count > 0:
+                self._populate_content()
+                
+        if self._content is not None:
+            self._proxy.set_filter(query, match_names)
+            visible_count = self._proxy.rowCount()
+            self._fit_content_height()
                 
         self.setVisible(visible_count > 0 or query == "")
         
@@ -504,28 +949,72 @@ class LayoutUsageTracker:
             self.config_path = home / ".config" / "audio_modules" / "layout_usage.json"
             
         self.usage_data: Dict[str, dict] = {}
+        self._dirty = False
+        self._file_sig: Optional[tuple] = None  # (mtime_ns, size) of the file last read or written
         self._load()
+        
+        # Coalesce bursts of changes into one write, off the click path
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self.flush)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush)
     
     def _ensure_config_dir(self):
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
     
+    def _stat_sig(self) -> Optional[tuple]:
+        try:
+            st = os.stat(self.config_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
+    def reload(self):
+        """Re-read the usage file if another process changed it; a no-op otherwise."""
+        if self._dirty:
+            return  # our own pending changes win
+        self._load()
+    
     def _load(self):
-        if not self.config_path.exists():
+        sig = self._stat_sig()
+        if sig is None or sig == self._file_sig:
             return
             
         try:
             with open(self.config_path, 'r') as f:
                 data = self._json.load(f)
+            self._file_sig = sig
             self.usage_data = data.get('layouts', {})
+            # Files written before last_used_ns existed only carry the ISO string
+            for entry in self.usage_data.values():
+                if 'last_used_ns' not in entry and entry.get('last_used'):
+                    stamp = self._datetime.fromisoformat(entry['last_used']).timestamp()
+                    entry['last_used_ns'] = int(stamp * 1_000_000_000)
         except Exception:
             pass
     
     def _save(self):
+        """Mark the data dirty and schedule a write."""
+        self._dirty = True
+        self._save_timer.start()
+    
+    def flush(self):
+        """Write pending changes now, atomically via a temp file."""
+        if not self._dirty:
+            return
+        self._save_timer.stop()
         try:
             self._ensure_config_dir()
             data = {'version': 1, 'layouts': self.usage_data}
-            with open(self.config_path, 'w') as f:
+            tmp_path = self.config_path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
                 self._json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.config_path)
+            self._dirty = False
+            self._file_sig = self._stat_sig()  # no need to re-read our own write
         except Exception:
             pass
     
@@ -535,6 +1024,7 @@ class LayoutUsageTracker:
             self.usage_data[layout_name] = {'use_count': 0, 'is_favorite': False}
         self.usage_data[layout_name]['use_count'] = self.usage_data[layout_name].get('use_count', 0) + 1
         self.usage_data[layout_name]['last_used'] = self._datetime.now().isoformat()
+        self.usage_data[layout_name]['last_used_ns'] = time.time_ns()
         self._save()
     
     def set_favorite(self, layout_name: str, is_favorite: bool):
@@ -550,13 +1040,10 @@ class LayoutUsageTracker:
     
     def get_recently_used(self, max_count: int = 10) -> List[str]:
         """Get list of recently used layouts."""
-        with_timestamps = [
-            (name, data.get('last_used', ''))
-            for name, data in self.usage_data.items()
-            if data.get('last_used')
-        ]
-        with_timestamps.sort(key=lambda x: x[1], reverse=True)
-        return [name for name, _ in with_timestamps[:max_count]]
+        # Top-K by integer timestamp instead of sorting every entry's ISO string
+        used = [(data['last_used_ns'], name) for name, data in self.usage_data.items()
+                if data.get('last_used_ns')]
+        return [name for _, name in heapq.nlargest(max_count, used)]
 
 
 class LayoutBrowser(QWidget):
@@ -576,6 +1063,10 @@ class LayoutBrowser(QWidget):
         self._layout_scanner = LayoutScanner(layouts_dir)
         self._usage_tracker = LayoutUsageTracker()
         self._category_sections: List[LayoutCategorySection] = []
+        self._scan_generation = 0
+        self._scan_worker: Optional[ScanWorker] = None
+        self._filter_generation = 0
+        self._filter_worker: Optional[FilterWorker] = None
         
         self.setWindowFlags(
             Qt.WindowType.Popup |
@@ -597,7 +1088,7 @@ class LayoutBrowser(QWidget):
                 border: 1px solid rgba(80, 80, 85, 0.8);
                 border-radius: 12px;
             }
-        """)
+        """ + LAYOUT_BUTTON_STYLE)
         
         container_layout = QVBoxLayout(self._container)
         container_layout.setContentsMargins(12, 10, 12, 10)
@@ -665,6 +1156,14 @@ class LayoutBrowser(QWidget):
         self._search_input = QLineEdit()
         self._search_input.setPlaceholderText("Search layouts...")
         self._search_input.textChanged.connect(self._on_search_changed)
+        
+        # Coalesce bursts of keystrokes into one filter pass
+        self._pending_query = ""
+        self._last_filter_text = ""  # query the sections are currently filtered by
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(120)
+        self._search_timer.timeout.connect(self._do_filter)
         self._search_input.setStyleSheet("""
             QLineEdit {
                 background-color: rgba(50, 50, 55, 0.9);
@@ -732,6 +1231,18 @@ class LayoutBrowser(QWidget):
         self._categories_layout.setSpacing(2)
         self._categories_layout.addStretch()
         
+        self._scanning_label = QLabel("Scanning...")
+        self._scanning_label.setStyleSheet("""
+            QLabel {
+                color: rgba(120, 120, 125, 0.6);
+                font-size: 11px;
+                font-style: italic;
+                padding: 2px 0;
+            }
+        """)
+        self._scanning_label.setVisible(False)
+        self._categories_layout.insertWidget(0, self._scanning_label)
+        
         scroll.setWidget(self._categories_widget)
         container_layout.addWidget(scroll, 1)
         
@@ -752,32 +1263,57 @@ class LayoutBrowser(QWidget):
         self._container.setGraphicsEffect(shadow)
         
     def refresh(self):
-        """Rescan layouts directory and rebuild UI."""
-        self._layout_scanner.scan(force=True)
+        """Rescan the layouts directory in the background and rebuild the UI when done."""
+        self._usage_tracker.reload()
         self._quick_access.set_scanner(self._layout_scanner)
+        self._scanning_label.setVisible(not self._category_sections)
+        
+        # Results from an older scan that finishes late are ignored
+        self._scan_generation += 1
+        worker = ScanWorker(self._layout_scanner, self._scan_generation)
+        worker.signals.finished.connect(self._on_scan_complete)
+        self._scan_worker = worker  # keep the signals object alive until delivery
+        QThreadPool.globalInstance().start(worker)
+        
+    def _on_scan_complete(self, generation: int, layouts: dict):
+        """Swap in freshly scanned layouts and rebuild (runs on the UI thread)."""
+        if generation != self._scan_generation:
+            return
+        self._scan_worker = None
+        self._layout_scanner.set_layouts(layouts)
+        self._scanning_label.setVisible(False)
         self._rebuild_categories()
         self._update_quick_access()
         
+        if self._pending_query:
+            self._do_filter()
+        
     def _rebuild_categories(self):
         """Rebuild the category sections from the scanner."""
-        for section in self._category_sections:
-            section.deleteLater()
-        self._category_sections.clear()
-        
-        favorites = self._usage_tracker.get_favorites()
-        
-        for category in self._layout_scanner.get_categories():
-            layouts = self._layout_scanner.get_layouts_in_category(category)
-            if layouts:
-                section = LayoutCategorySection(category, layouts, favorites)
-                section.layoutClicked.connect(self._on_layout_clicked)
-                section.favoriteToggled.connect(self._on_favorite_toggled)
-                section.loadRequested.connect(self._on_load_requested)
-                section.addRequested.connect(self._on_add_requested)
-                self._category_sections.append(section)
-                self._categories_layout.insertWidget(
-                    self._categories_layout.count() - 1, section
-                )
+        # Suspend painting so the whole rebuild costs one relayout + repaint
+        self._categories_widget.setUpdatesEnabled(False)
+        try:
+            for section in self._category_sections:
+                section.deleteLater()
+            self._category_sections.clear()
+            self._last_filter_text = ""  # new sections start unfiltered
+            
+            favorites = self._usage_tracker.get_favorites()
+            
+            for category in self._layout_scanner.get_categories():
+                layouts = self._layout_scanner.get_layouts_in_category(category)
+                if layouts:
+                    section = LayoutCategorySection(category_display(category), layouts, favorites)
+                    section.layoutClicked.connect(self._on_layout_clicked)
+                    section.favoriteToggled.connect(self._on_favorite_toggled)
+                    section.loadRequested.connect(self._on_load_requested)
+                    section.addRequested.connect(self._on_add_requested)
+                    self._category_sections.append(section)
+                    self._categories_layout.insertWidget(
+                        self._categories_layout.count() - 1, section
+                    )
+        finally:
+            self._categories_widget.setUpdatesEnabled(True)
                 
     def _update_quick_access(self):
         """Update the quick access bar."""
@@ -816,9 +1352,37 @@ class LayoutBrowser(QWidget):
         self._update_quick_access()
         
     def _on_search_changed(self, text: str):
-        """Handle search input changes."""
+        """Handle search input changes (debounced; clearing applies at once)."""
+        self._pending_query = text
+        if not text:
+            # Nothing to match, so there is no work to coalesce
+            self._search_timer.stop()
+            self._do_filter()
+            return
+        self._search_timer.start()
+        
+    def _do_filter(self):
+        """Match the latest search query on a worker, then apply it to the sections."""
+        text = self._pending_query
+        self._filter_generation += 1
+        if not text:
+            self._filter_worker = None
+            self._apply_filter(self._filter_generation, "", None)
+            return
+            
+        worker = FilterWorker(self._layout_scanner, text, self._filter_generation)
+        worker.signals.finished.connect(self._apply_filter)
+        self._filter_worker = worker  # keep the signals object alive until delivery
+        QThreadPool.globalInstance().start(worker)
+        
+    def _apply_filter(self, generation: int, query: str, match_names: Optional[Set[str]]):
+        """Show only matching rows (runs on the UI thread); stale results are dropped."""
+        if generation != self._filter_generation:
+            return
+        self._filter_worker = None
+        self._last_filter_text = query
         for section in self._category_sections:
-            section.filter_layouts(text)
+            section.filter_layouts(query, match_names)
             
     def show_at(self, global_pos: QPoint):
         """Show the browser at a specific screen position."""
@@ -848,10 +1412,9 @@ class LayoutBrowser(QWidget):
             
         self.show()
         self._search_input.setFocus()
+        # Clearing a non-empty box resets the sections synchronously (see
+        # _on_search_changed); an empty box has no filter applied
         self._search_input.clear()
-        
-        for section in self._category_sections:
-            section.filter_layouts("")
             
     def show_below(self, widget: QWidget):
         """Show the browser below a widget."""
@@ -4,14 +4,16 @@ import numpy as np
 import sounddevice as sd
 import json
 import threading
+import queue
 import uuid
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QFileDialog, QMessageBox, QWidget, QVBoxLayout
 )
-from PyQt6.QtCore import QPointF
+from PyQt6.QtCore import QPointF, QTimer
 
 from source.audio_module import AudioModule
+from source.audio_kernels import mix_clip_scale
 from source.toolbar_manager import ToolbarManager
 from source.ui_elements import ModuleItem, ConnectionPath
 from modules.endpoint import Endpoint
@@ -20,10 +22,6 @@ from source.workspace_scene import WorkspaceScene
 from source.workspace_view import WorkspaceView
 
 
-def db_to_linear(db_value: float) -> float:
-    return 10.0 ** (db_value / 20.0)
-
-
 class MainWindow(QMainWindow):
     """Main application window with threaded real-time audio generation using a ring buffer."""
     def __init__(self):
@@ -64,8 +62,13 @@ class MainWindow(QMainWindow):
         # Audio backend
         self.sample_rate = 44100
         self.block_size = 8192
+        # Scratch mix for _generate_mix_block calls made without a ring slot
+        self._mix_buf = np.zeros((self.block_size, 2), dtype=np.float32)
         self.modules: list[AudioModule] = []
         self.endpoints: list[AudioModule] = []
+        # Immutable copy of `endpoints` read by the audio worker; rebinding
+        # the reference is atomic, so the worker never sees a list mid-edit
+        self._endpoints_snapshot: tuple = ()
 
         # Toolbar manager
         self.toolbar_manager = ToolbarManager(self)
@@ -75,6 +78,12 @@ class MainWindow(QMainWindow):
         self.mixer.setParent(self.container)
         self.mixer.raise_()
 
+        # Endpoint.generate runs on the audio worker and only queues meter
+        # levels; they are applied to the widgets here at ~30 Hz
+        self._ui_timer = QTimer(self)
+        self._ui_timer.timeout.connect(self._drain_ui_updates)
+        self._ui_timer.start(33)
+
         # Whenever mixer collapses/expands, reposition it
         if hasattr(self.mixer, "toggled"):
             self.mixer.toggled.connect(self._reposition_mixer)
@@ -82,11 +91,16 @@ class MainWindow(QMainWindow):
         # --- Ring buffer configuration ---
         self.ring_size = 2  # Number of blocks ahead to prefill
         self.ring_buffer = np.zeros((self.ring_size, self.block_size, 2), dtype=np.float32)
-        self.write_index = 0  # Worker writes here
-        self.read_index = 0   # Callback reads here
-        self.available_blocks = 0
-        self._buffer_lock = threading.Lock()
-        self._buffer_cond = threading.Condition(self._buffer_lock)
+        # Single-producer/single-consumer, no lock (same scheme as SPSCRing):
+        # both are monotonically increasing block counts, each owned by one
+        # side and published only after its slot's data is in place
+        self._wr = 0  # blocks written, owned by the worker
+        self._rd = 0  # blocks played, owned by the audio callback
+        # Wakes a worker blocked on a full ring. SimpleQueue.put never blocks,
+        # so the callback can signal it without taking a lock; the callback
+        # only does so while the worker has flagged that it is waiting
+        self._slot_freed = queue.SimpleQueue()
+        self._worker_waiting = False
 
         # Stop signal for worker
         self._stop_event = threading.Event()
@@ -96,10 +110,13 @@ class MainWindow(QMainWindow):
         self._worker_thread.start()
 
         # --- Start audio output ---
+        # The worker keeps ring_size blocks prefilled, which already covers
+        # scheduling jitter, so ask the host API for no extra buffering
         self.stream = sd.OutputStream(
             channels=2,
             samplerate=self.sample_rate,
             blocksize=self.block_size,
+            latency="low",
             callback=self.audio_callback,
             dtype="float32",
         )
@@ -120,59 +137,88 @@ class MainWindow(QMainWindow):
 
         self.mixer.setGeometry(0, ch - mh, cw, mh)
 
+    def _drain_ui_updates(self):
+        """Apply UI state queued by the audio worker."""
+        for endpoint in self._endpoints_snapshot:
+            endpoint.drain_levels()
+
     # ---------- Worker Thread ----------
     def _audio_worker_loop(self):
         """Continuously fill the ring buffer with precomputed audio blocks."""
-        while not self._stop_event.is_set():
-            with self._buffer_cond:
-                # Wait until there is room in the ring buffer
-                while self.available_blocks >= self.ring_size and not self._stop_event.is_set():
-                    self._buffer_cond.wait(timeout=0.01)
-
-                if self._stop_event.is_set():
-                    break
-
-            # Generate outside the lock so the callback isn't blocked
-            block = self._generate_mix_block(self.block_size)
+        stop = self._stop_event
+        while not stop.is_set():
+            wr = self._wr
+            if wr - self._rd >= self.ring_size:
+                # Ring full: sleep until the callback frees a slot. Re-check
+                # after raising the flag so a slot freed in between is not
+                # missed; the timeout is only a safety net.
+                self._worker_waiting = True
+                if self._wr - self._rd >= self.ring_size and not stop.is_set():
+                    try:
+                        self._slot_freed.get(timeout=0.05)
+                    except queue.Empty:
+                        pass
+                self._worker_waiting = False
+                continue
 
-            with self._buffer_cond:
-                np.copyto(self.ring_buffer[self.write_index], block)
-                self.write_index = (self.write_index + 1) % self.ring_size
-                self.available_blocks = min(self.available_blocks + 1, self.ring_size)
+            # The slot is not readable until _wr is bumped, so the mix is
+            # built directly in the ring
+            self._generate_mix_block(self.block_size, out=self.ring_buffer[wr % self.ring_size])
+            self._wr = wr + 1  # publish after the data is in place
 
     # ---------- Mixing ----------
-    def _generate_mix_block(self, frames: int) -> np.ndarray:
-        """Generate a single block of mixed audio from endpoints."""
-        if not self.endpoints:
-            return np.zeros((frames, 2), dtype=np.float32)
+    def _generate_mix_block(self, frames: int, out: np.ndarray = None) -> np.ndarray:
+        """
+        Generate a single block of mixed audio from endpoints, into `out` if
+        given. Without `out` the result is a view of a reused scratch buffer,
+        valid until the next call.
+        """
+        if out is not None:
+            mix = out
+        elif frames <= self._mix_buf.shape[0]:
+            mix = self._mix_buf[:frames]
+        else:
+            mix = self._mix_buf = np.empty((frames, 2), dtype=np.float32)
+
+        endpoints = self._endpoints_snapshot
+        if not endpoints:
+            mix.fill(0.0)
+            return mix
 
-        mix = np.zeros((frames, 2), dtype=np.float32)
-        for endpoint in self.endpoints:
+        blocks = []
+        peak_sum = 0.0
+        for endpoint in endpoints:
             try:
                 audio = endpoint.generate(frames)
             except Exception:
                 continue
             if audio is not None:
-                n = min(audio.shape[0], frames)
-                mix[:n] += audio[:n]
-
-        np.clip(mix, -1.0, 1.0, out=mix)
-        mix *= db_to_linear(self.mixer.master_volume_db)
-        return mix
+                blocks.append(audio)
+                peak_sum += endpoint.last_peak
+        if not blocks:
+            # Every endpoint is muted or at -inf dB: no clip or gain pass
+            mix.fill(0.0)
+            return mix
+
+        # The mix cannot exceed the sum of the endpoint peaks, so the clip
+        # pass is only needed when that bound goes over full scale
+        return mix_clip_scale(
+            blocks, mix, self.mixer.master_gain, peak_sum > 1.0
+        )
 
     # ---------- Audio Callback ----------
     def audio_callback(self, outdata, frames, time, status):
         """Real-time audio callback reads the next available block from the ring buffer."""
         try:
-            with self._buffer_cond:
-                if self.available_blocks > 0:
-                    np.copyto(outdata, self.ring_buffer[self.read_index])
-                    self.read_index = (self.read_index + 1) % self.ring_size
-                    self.available_blocks -= 1
-                    # Notify the worker that a slot is now free
-                    self._buffer_cond.notify()
-                else:
-                    outdata.fill(0)
+            rd = self._rd
+            if self._wr - rd > 0:
+                # Same-shape float32 slice assignment is a straight memcpy
+                outdata[:] = self.ring_buffer[rd % self.ring_size]
+                self._rd = rd + 1  # hands the slot back to the worker
+                if self._worker_waiting:
+                    self._slot_freed.put_nowait(None)
+            else:
+                outdata.fill(0)
         except Exception:
             outdata.fill(0)
 
@@ -180,9 +226,7 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         """Stop worker and audio stream."""
         self._stop_event.set()
-        # Wake the worker so it sees the stop event
-        with self._buffer_cond:
-            self._buffer_cond.notify()
+        self._slot_freed.put_nowait(None)  # wake a worker waiting for a free slot
         self._worker_thread.join(timeout=1.0)
         if hasattr(self, "stream") and self.stream:
             self.stream.stop()
@@ -190,6 +234,9 @@ class MainWindow(QMainWindow):
         super().closeEvent(event)
 
     def spawn_module(self, module: AudioModule):
+        # Size the module's block buffers for the engine before it is pulled
+        module.prepare(self.block_size)
+
         # Create visual representation
         item = ModuleItem(module, self)
 
@@ -203,18 +250,28 @@ class MainWindow(QMainWindow):
         # Register module
         if type(module).__name__ == "Endpoint":
             self.endpoints.append(module)
+            self._endpoints_snapshot = tuple(self.endpoints)
             self.mixer.add_endpoint(module)
         else:
             self.modules.append(module)
+        self._on_modules_changed()
 
     def destroy_module(self, module):
         if isinstance(module, Endpoint):
             self.mixer.remove_endpoint(module)
             if module in self.endpoints:
                 self.endpoints.remove(module)
+                self._endpoints_snapshot = tuple(self.endpoints)
         else:
             if module in self.modules:
                 self.modules.remove(module)
+        self._on_modules_changed()
+
+    def _on_modules_changed(self):
+        """Retune the workspace after modules are added or removed."""
+        count = len(self.modules) + len(self.endpoints)
+        self.view.set_module_count(count)
+        self.scene.set_module_count(count)
 
     def save_layout(self, path: str):
         """Save all modules, nodes, and connections to a .layout JSON file."""
@@ -282,6 +339,8 @@ class MainWindow(QMainWindow):
         self.scene.clear()
         self.modules.clear()
         self.endpoints.clear()
+        self._endpoints_snapshot = ()
+        self._on_modules_changed()
         self.mixer.scroll_layout.update()
         module_map = {}  # module_id → ModuleItem
 
@@ -4,6 +4,8 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QScrollArea, QPushButton
 )
 
+from source.audio_module import db_to_linear
+
 
 # ----------------- PyQt6-safe deletion check -----------------
 def is_dead(obj):
@@ -27,7 +29,7 @@ class Mixer(QWidget):
         self.main_window = main_window
         self.endpoints = []
         self.channel_strips = []
-        self.master_volume_db = 0.0
+        self.master_volume_db = 0.0  # also sets master_gain
         self.is_expanded = False
         self.anim = None
 
@@ -79,6 +81,19 @@ class Mixer(QWidget):
         layout.addWidget(self.toggle_button)
         layout.addWidget(self.scroll_area)
 
+    # ---------------------------------------------------------
+    # MASTER GAIN (recomputed on changes, not per block)
+    # ---------------------------------------------------------
+    @property
+    def master_volume_db(self):
+        return self._master_volume_db
+
+    @master_volume_db.setter
+    def master_volume_db(self, value):
+        self._master_volume_db = value
+        # Read by the audio worker; rebinding a float is atomic
+        self.master_gain = db_to_linear(value)
+
     # ---------------------------------------------------------
     # SYNC TIMER
     # ---------------------------------------------------------
@@ -187,6 +187,10 @@ class QuickAccessBar(QWidget):
         """Set the module registry for lookups."""
         self._module_registry = registry
         
+    def _emit_click(self):
+        """Shared clicked slot: the button itself says which module it is."""
+        self.moduleClicked.emit(self.sender().module_info.name)
+        
     def update_modules(self, favorites: List[str], history: List[str]):
         """
         Update the quick access sections.
@@ -195,6 +199,14 @@ class QuickAccessBar(QWidget):
             favorites: List of favorited module names
             history: List of recently used module names (excluding favorites)
         """
+        # Suspend painting so the whole update costs one relayout + repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self._update_modules(favorites, history)
+        finally:
+            self.setUpdatesEnabled(True)
+            
+    def _update_modules(self, favorites: List[str], history: List[str]):
         # Clear existing buttons
         for btn in self._buttons.values():
             btn.deleteLater()
@@ -209,7 +221,7 @@ class QuickAccessBar(QWidget):
             info = self._module_registry.get_module(name)
             if info:
                 btn = ModuleButton(info, is_favorite=True, compact=True)
-                btn.clicked.connect(lambda checked, n=name: self.moduleClicked.emit(n))
+                btn.clicked.connect(self._emit_click)
                 btn.favoriteToggled.connect(self.favoriteToggled.emit)
                 self._buttons[f"fav_{name}"] = btn
                 self._favorites_layout.insertWidget(self._favorites_layout.count() - 1, btn)
@@ -221,7 +233,7 @@ class QuickAccessBar(QWidget):
             info = self._module_registry.get_module(name)
             if info:
                 btn = ModuleButton(info, is_favorite=False, compact=True)
-                btn.clicked.connect(lambda checked, n=name: self.moduleClicked.emit(n))
+                btn.clicked.connect(self._emit_click)
                 btn.favoriteToggled.connect(self.favoriteToggled.emit)
                 self._buttons[f"hist_{name}"] = btn
                 self._history_layout.insertWidget(self._history_layout.count() - 1, btn)
@@ -291,13 +303,17 @@ class CategorySection(QWidget):
         for module_info in sorted_modules:
             is_fav = module_info.name in self._favorites
             btn = ModuleButton(module_info, is_favorite=is_fav)
-            btn.clicked.connect(lambda checked, n=module_info.name: self.moduleClicked.emit(n))
+            btn.clicked.connect(self._emit_click)
             btn.favoriteToggled.connect(self._on_favorite_toggled)
             self._buttons.append(btn)
             content_layout.addWidget(btn)
             
         layout.addWidget(self._content)
         
+    def _emit_click(self):
+        """Shared clicked slot: the button itself says which module it is."""
+        self.moduleClicked.emit(self.sender().module_info.name)
+        
     def _on_favorite_toggled(self, name: str, is_favorite: bool):
         """Handle favorite toggle from a button."""
         if is_favorite:
@@ -533,18 +549,23 @@ class ModuleBrowser(QWidget):
             
         favorites = self._get_favorites()
         
-        # Create sections for each category
-        for category in self._module_registry.get_categories():
-            modules = self._module_registry.get_modules_in_category(category)
-            if modules:
-                section = CategorySection(category, modules, favorites)
-                section.moduleClicked.connect(self._on_module_clicked)
-                section.favoriteToggled.connect(self._on_favorite_toggled)
-                self._category_sections.append(section)
-                # Insert before stretch
-                self._categories_layout.insertWidget(
-                    self._categories_layout.count() - 1, section
-                )
+        # Suspend painting so the whole rebuild costs one relayout + repaint
+        self._categories_widget.setUpdatesEnabled(False)
+        try:
+            # Create sections for each category
+            for category in self._module_registry.get_categories():
+                modules = self._module_registry.get_modules_in_category(category)
+                if modules:
+                    section = CategorySection(category, modules, favorites)
+                    section.moduleClicked.connect(self._on_module_clicked)
+                    section.favoriteToggled.connect(self._on_favorite_toggled)
+                    self._category_sections.append(section)
+                    # Insert before stretch
+                    self._categories_layout.insertWidget(
+                        self._categories_layout.count() - 1, section
+                    )
+        finally:
+            self._categories_widget.setUpdatesEnabled(True)
                 
     def _get_favorites(self) -> List[str]:
         """Get list of favorite module names."""
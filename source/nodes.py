@@ -5,9 +5,20 @@ from typing import Optional, TYPE_CHECKING, Any, Callable
 if TYPE_CHECKING:
     from audio_module import AudioModule
 
+
+def _ensure_stereo_f32(data: Any) -> Any:
+    """Return an audio block as C-contiguous float32, copying only when it is not already."""
+    if isinstance(data, np.ndarray) and (data.dtype != np.float32 or not data.flags.c_contiguous):
+        return np.ascontiguousarray(data, dtype=np.float32)
+    return data
+
 class Node:
     """Unified node class that can send and receive data."""
-    
+
+    # Fixed field layout: no per-node __dict__
+    __slots__ = ("module", "is_input", "data_type", "color", "position",
+                 "label", "connection", "block_touch")
+
     def __init__(self, module: 'AudioModule', is_input: bool = True, data_type: str = "audio",
                  color: str = None, position: str = None, label: str = "Audio"):
         """
@@ -32,8 +43,11 @@ class Node:
         self.block_touch = True
 
     def disconnect(self):
-        """Disconnect this node from its connected counterpart."""
-        if self.connection:
+        """
+        Disconnect this node from its connected counterpart.
+        Idempotent and never raises, so callers need no exception handling.
+        """
+        if self.connection is not None:
             self.connection.connection = None
             self.connection = None
 
@@ -76,11 +90,24 @@ class Node:
         if not self.is_input:
             raise RuntimeError("Cannot receive on an output node")
         
-        if self.connection is None:
+        source = self.connection
+        if source is None:
             # Return default data based on type
             return self._get_default_data(frames)
-        
-        return self.connection.send(frames)
+
+        # Inlined Node.send: this is the per-edge hop of the pull-based graph,
+        # so skip the extra call and its re-checks (the connection is
+        # bidirectional, so `source` is a connected output node)
+        if source.data_type == "cue" and hasattr(source.module, 'current_cue_out'):
+            cue = source.module.current_cue_out
+            return cue if cue is not None else source._get_default_data(frames)
+
+        data = source.module.generate(frames)
+        if source.data_type == "audio":
+            # Keep the float32 contract at every edge so a stray float64
+            # producer cannot double the bandwidth of everything downstream
+            data = _ensure_stereo_f32(data)
+        return data
 
     def send(self, frames: int) -> Any:
         """
@@ -118,6 +145,8 @@ class Node:
 # Backward compatibility aliases
 class InputNode(Node):
     """Input node - receives data from output nodes."""
+    __slots__ = ()
+
     def __init__(self, module: 'AudioModule', data_type: str = "audio", 
                  color: str = None, position: str = None, label: str = "Audio"):
         super().__init__(module, is_input=True, data_type=data_type, 
@@ -126,6 +155,8 @@ class InputNode(Node):
 
 class OutputNode(Node):
     """Output node - sends data to input nodes."""
+    __slots__ = ()
+
     def __init__(self, module: 'AudioModule', data_type: str = "audio",
                  color: str = None, position: str = None, label: str = "Audio"):
         super().__init__(module, is_input=False, data_type=data_type,
@@ -0,0 +1,109 @@
+# ring_buffer.py
+"""
+Single-producer / single-consumer audio ring buffer.
+
+Used to hand audio from a sounddevice callback thread to the engine worker
+without a lock. The producer only ever advances ``_head`` and the consumer
+only ever advances ``_tail``; both are monotonically increasing frame
+counts, wrapped into the storage with a power-of-two mask.
+"""
+
+import numpy as np
+
+
+class SPSCRing:
+    """
+    Lock-free stereo float32 ring for exactly one writer and one reader.
+
+    - write_from(): producer side, never blocks; on overrun the oldest
+      audio is overwritten and the reader skips ahead to it
+    - read_into(): consumer side, fills the requested frames and
+      zero-fills whatever is not yet available (underrun); optionally
+      drops the oldest audio so the backlog cannot grow into latency
+    """
+
+    def __init__(self, min_capacity: int, channels: int = 2):
+        capacity = 1
+        while capacity < min_capacity:
+            capacity <<= 1
+        self.capacity = capacity
+        self._mask = capacity - 1
+        self._data = np.zeros((capacity, channels), dtype=np.float32)
+
+        # Python int stores are atomic under the GIL. Each side writes the
+        # sample data first and publishes its counter last, so the other
+        # side never observes a counter ahead of the data (the GIL switch
+        # acts as the memory fence).
+        self._head = 0  # frames written, owned by the producer
+        self._tail = 0  # frames read, owned by the consumer
+
+    def available(self) -> int:
+        """Frames currently readable (capped at capacity)."""
+        return min(self._head - self._tail, self.capacity)
+
+    def write_from(self, in_view: np.ndarray):
+        """
+        Append a block of shape (frames, channels). Mono input is
+        duplicated into every channel. Never allocates.
+        """
+        frames = len(in_view)
+        capacity = self.capacity
+        if frames > capacity:
+            in_view = in_view[-capacity:]
+            frames = capacity
+
+        data = self._data
+        head = self._head
+        start = head & self._mask
+        first = min(frames, capacity - start)
+        rest = frames - first
+
+        if in_view.shape[1] == data.shape[1]:
+            np.copyto(data[start:start + first], in_view[:first])
+            if rest:
+                np.copyto(data[:rest], in_view[first:])
+        else:
+            src = in_view[:, 0]
+            for ch in range(data.shape[1]):
+                np.copyto(data[start:start + first, ch], src[:first])
+                if rest:
+                    np.copyto(data[:rest, ch], src[first:])
+
+        # Publish after the data is in place
+        self._head = head + frames
+
+    def read_into(self, out_view: np.ndarray, max_backlog: int | None = None) -> int:
+        """
+        Fill out_view (frames, channels) from the ring, zero-filling on
+        underrun. Returns the number of frames actually read.
+
+        If more than `max_backlog` frames are buffered, the oldest are
+        skipped first. Producer and consumer run at the same rate, so a
+        backlog built up while nobody was reading would otherwise persist
+        as fixed latency.
+        """
+        frames = len(out_view)
+        head = self._head
+        tail = self._tail
+        if head - tail > self.capacity:
+            # Overrun: the producer lapped us, drop the oldest audio
+            tail = head - self.capacity
+        if max_backlog is not None and head - tail > max_backlog:
+            tail = head - max_backlog
+
+        n = min(frames, head - tail)
+        start = tail & self._mask
+        first = min(n, self.capacity - start)
+        np.copyto(out_view[:first], self._data[start:start + first])
+        if first < n:
+            np.copyto(out_view[first:n], self._data[:n - first])
+        if n < frames:
+            out_view[n:] = 0.0
+
+        # Publish after the data has been copied out
+        self._tail = tail + n
+        return n
+
+    def clear(self):
+        """Discard everything currently buffered (consumer side)."""
+        self._tail = self._head
@@ -18,6 +18,7 @@ class ConnectionPath(QGraphicsPathItem):
         super().__init__()
         self.start_node = start_node
         self.end_node = end_node
+        self._drag_start: QPointF | None = None  # start anchor, fixed while dragging
 
         # Visuals
         color = color or QColor(180, 180, 180)
@@ -50,6 +51,7 @@ class ConnectionPath(QGraphicsPathItem):
         """Recompute cubic bezier between start_node and end_node."""
         if not (self.start_node and self.end_node):
             return
+        self._drag_start = None  # the modules may move from here on
         start = self.start_node.scenePos() + QPointF(self.start_node.RADIUS, 0)
         end = self.end_node.scenePos() - QPointF(self.end_node.RADIUS, 0)
         path = QPainterPath(start)
@@ -61,7 +63,10 @@ class ConnectionPath(QGraphicsPathItem):
         """Used during dragging: draw path from start node to arbitrary scene position."""
         if not self.start_node:
             return
-        start = self.start_node.scenePos() + QPointF(self.start_node.RADIUS, 0)
+        start = self._drag_start
+        if start is None:
+            # The output node cannot move mid-drag, so map it to the scene once
+            start = self._drag_start = self.start_node.scenePos() + QPointF(self.start_node.RADIUS, 0)
         path = QPainterPath(start)
         dx = (end_pos.x() - start.x()) * 0.5
         path.cubicTo(start + QPointF(dx, 0), end_pos - QPointF(dx, 0), end_pos)
@@ -171,6 +176,11 @@ class NodeCircle(QGraphicsEllipseItem):
         # Temporary connection during drag
         self.temp_connection: ConnectionPath | None = None
 
+        # Drag-path throttle: moves arrive far faster than frames, so the
+        # bezier is rebuilt at most once per ~16 ms (one 60 Hz frame)
+        self._drag_timer: QTimer | None = None
+        self._pending_drag_pos: QPointF | None = None
+
     def update_label_position(self):
         """Update the label position based on node type and custom position."""
         if not self.label:
@@ -319,25 +329,54 @@ class NodeCircle(QGraphicsEllipseItem):
 
         super().mousePressEvent(event)
 
+    DRAG_UPDATE_MS = 16
+
     def mouseMoveEvent(self, event):
         if self.temp_connection:
+            self._pending_drag_pos = self.mapToScene(event.pos())
+            if self._drag_timer is None:
+                self._drag_timer = QTimer()
+                self._drag_timer.setSingleShot(True)
+                self._drag_timer.setInterval(self.DRAG_UPDATE_MS)
+                self._drag_timer.timeout.connect(self._flush_drag_pos)
+            if not self._drag_timer.isActive():
+                # Leading edge: draw now, then coalesce until the timer fires
+                self._flush_drag_pos()
+                self._drag_timer.start()
+        super().mouseMoveEvent(event)
+
+    def _flush_drag_pos(self):
+        """Redraw the temp connection to the latest pending drag position."""
+        pos = self._pending_drag_pos
+        self._pending_drag_pos = None
+        if pos is not None and self.temp_connection:
             try:
-                scene_pos = self.mapToScene(event.pos())
-                self.temp_connection.update_path_from_pos(scene_pos)
+                self.temp_connection.update_path_from_pos(pos)
             except Exception:
                 pass
-        super().mouseMoveEvent(event)
 
     def mouseReleaseEvent(self, event):
+        # The release below finalizes or removes the path itself
+        if self._drag_timer is not None:
+            self._drag_timer.stop()
+        self._pending_drag_pos = None
+
         # When releasing an output connection, finalize or discard
         if self.temp_connection:
             try:
                 scene_pos = self.mapToScene(event.pos())
-                items = self.scene().items(scene_pos) if self.scene() else []
+                # Bounding-rect hits come straight from the scene index; the
+                # exact shape test is then run only on input nodes, not on
+                # every bezier path and module under the cursor
+                sc = self.scene()
+                items = sc.items(
+                    scene_pos, Qt.ItemSelectionMode.IntersectsItemBoundingRect
+                ) if sc else []
                 target_input = next(
                     (it for it in items 
                      if isinstance(it, NodeCircle) 
                      and it.node_type == "input"
+                     and it.contains(it.mapFromScene(scene_pos))
                      and self.can_connect_to(it)),  # Check data type compatibility
                     None
                 )
@@ -437,6 +476,8 @@ class CloseButton(QGraphicsSimpleTextItem):
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self.parent_module_item = parent_module_item
         self.setAcceptedMouseButtons(Qt.MouseButton.LeftButton)
+        # Static glyph: rasterize once instead of on every repaint
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
 
     def mousePressEvent(self, event):
         try:
@@ -468,10 +509,17 @@ class ModuleItem(QGraphicsRectItem):
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges)
         self.setAcceptHoverEvents(True)
+        # The frame only changes on resize/selection; reuse its pixmap on pans
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
 
         self.label = QGraphicsTextItem(module.__class__.__name__, self)
         self.label.setDefaultTextColor(QColor(255, 255, 255))
         self.label.setPos(10, 5)
+        # Text layout and glyph rasterization dominate a module's repaint
+        # cost; the title only changes through setPlainText, which
+        # invalidates the cache itself. Nodes (hover highlight) and the
+        # embedded widget (live controls) are left uncached.
+        self.label.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
 
         self.close_button = CloseButton(self)
 
@@ -1,15 +1,55 @@
+import math
+from functools import lru_cache
+
 from PyQt6.QtWidgets import QGraphicsScene
 from PyQt6.QtGui import QBrush, QColor, QPainter, QPen
-from PyQt6.QtCore import QPointF, QLineF
+from PyQt6.QtCore import QPointF, QLineF, QRectF
+
+
+@lru_cache(maxsize=16)
+def _grid_lines(left: int, top: int, right: int, bottom: int, step: int) -> list:
+    """
+    Grid lines covering the integer rect [left, right] x [top, bottom] at
+    `step` spacing. Repaints of an unchanged exposed rect reuse the list;
+    callers must not modify it.
+    """
+    first_x = left + -left % step  # first multiple of step >= left
+    first_y = top + -top % step
+    lines = [QLineF(x, top, x, bottom) for x in range(first_x, right + 1, step)]
+    lines += [QLineF(left, y, right, y) for y in range(first_y, bottom + 1, step)]
+    return lines
 
 
 class WorkspaceScene(QGraphicsScene):
+    # Scrollable extent of the workspace. It is applied to the view, not the
+    # scene: the scene rect is left to track the items, so the BSP index
+    # partitions the area the modules actually occupy.
+    CANVAS_RECT = QRectF(-100000, -100000, 200000, 200000)
+
+    # Below this many modules a linear scan beats maintaining the BSP tree
+    INDEX_MODULE_COUNT = 20
+
     def __init__(self):
         super().__init__()
         self.setBackgroundBrush(QBrush(QColor(25, 25, 25)))
         self.grid_size = 25
         self.grid_color = QColor(50, 50, 50)
-        self.setSceneRect(-100000, -100000, 200000, 200000)
+        self._grid_pen = QPen(self.grid_color)
+        self._grid_pen.setWidthF(1.0)
+        self._grid_pen.setCosmetic(True)  # width stays 1px regardless of zoom
+        self.set_module_count(0)
+        self._primary_view = None  # set by WorkspaceView so paints skip views()
+
+    def set_module_count(self, count: int):
+        """Pick the item index for a scene holding `count` modules."""
+        if count < self.INDEX_MODULE_COUNT:
+            method = QGraphicsScene.ItemIndexMethod.NoIndex
+        else:
+            method = QGraphicsScene.ItemIndexMethod.BspTreeIndex
+        if self.itemIndexMethod() != method:
+            self.setItemIndexMethod(method)
+            if method == QGraphicsScene.ItemIndexMethod.BspTreeIndex:
+                self.setBspTreeDepth(0)  # let Qt size the tree to the items
 
     def drawBackground(self, painter, rect):
         painter.save()
@@ -18,10 +58,12 @@ class WorkspaceScene(QGraphicsScene):
 
         # Determine screen-space pixel size of one scene unit.
         # If no view exists, assume 1:1.
-        views = self.views()
-        if views:
-            tx = views[0].transform()
-            scale = tx.m11()  # horizontal scale factor
+        view = self._primary_view
+        if view is None:
+            views = self.views()
+            view = views[0] if views else None
+        if view is not None:
+            scale = view.transform().m11()  # horizontal scale factor
         else:
             scale = 1.0
 
@@ -35,27 +77,15 @@ class WorkspaceScene(QGraphicsScene):
             painter.restore()
             return
 
-        # Snap to grid boundaries
-        left = int(rect.left()) - (int(rect.left()) % effective_grid)
-        top = int(rect.top()) - (int(rect.top()) % effective_grid)
-
-        pen = QPen(self.grid_color)
-        pen.setWidthF(1.0)
-        pen.setCosmetic(True)  # width stays 1px regardless of zoom
-        painter.setPen(pen)
-
-        # Collect all lines into a list, then draw in one batch
-        lines = []
-        x = left
-        while x <= rect.right():
-            lines.append(QLineF(x, rect.top(), x, rect.bottom()))
-            x += effective_grid
-
-        y = top
-        while y <= rect.bottom():
-            lines.append(QLineF(rect.left(), y, rect.right(), y))
-            y += effective_grid
+        painter.setPen(self._grid_pen)
 
+        # All lines go out in one drawLines batch; the integer rect that
+        # encloses the exposed area keys the cache (the excess is clipped)
+        lines = _grid_lines(
+            math.floor(rect.left()), math.floor(rect.top()),
+            math.ceil(rect.right()), math.ceil(rect.bottom()),
+            effective_grid,
+        )
         if lines:
             painter.drawLines(lines)
 
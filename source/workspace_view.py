@@ -1,16 +1,24 @@
 # workspace_view.py
+import math
+import os
 import time
 
 from PyQt6.QtWidgets import (
     QGraphicsView, QGraphicsRectItem, QMenu, QPinchGesture
 )
 from PyQt6.QtGui import (
-    QBrush, QColor, QPainter, QPen, QAction, QNativeGestureEvent, QCursor, QWheelEvent
+    QBrush, QColor, QPainter, QPen, QAction, QNativeGestureEvent, QWheelEvent,
+    QMouseEvent
 )
 from PyQt6.QtCore import (
     Qt, QPointF, QRectF, QEvent, QTimer
 )
 
+try:
+    from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+except ImportError:  # Qt built without OpenGL support
+    QOpenGLWidget = None
+
 from source.ui_elements import ModuleItem, NodeCircle, ConnectionPath
 
 
@@ -20,26 +28,66 @@ class WorkspaceView(QGraphicsView):
     INERTIA_FPS = 60
     INERTIA_DECAY = 0.93
     INERTIA_MIN_VEL = 0.5
+    FULL_UPDATE_MODULE_COUNT = 200
 
     def __init__(self, scene, main_window=None):
         super().__init__(scene)
+        scene._primary_view = self
+        self.setSceneRect(scene.CANVAS_RECT)
+
+        # Optional OpenGL viewport (HTP_OPENGL_VIEWPORT=1). Off by default:
+        # module UIs are QGraphicsProxyWidgets, which a GL viewport has to
+        # re-upload as textures on every change, and it forces full-viewport
+        # repaints. Must happen before any viewport() attributes are set below.
+        self._gl_viewport = (
+            QOpenGLWidget is not None
+            and os.environ.get("HTP_OPENGL_VIEWPORT", "") == "1"
+        )
+        if self._gl_viewport:
+            self.setViewport(QOpenGLWidget())
         self.main_window = main_window
         self.setRenderHint(QPainter.RenderHint.Antialiasing, False)
         self.setBackgroundBrush(QBrush(Qt.BrushStyle.NoBrush))
         self.setDragMode(QGraphicsView.DragMode.NoDrag)
         self.zoom_factor = 1.15
 
+        # Smooth wheel zoom: ticks add to a pending log-scale that a 60 Hz
+        # timer applies in exponentially shrinking steps
+        self._zoom_pending_log = 0.0
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setInterval(16)
+        self._zoom_timer.timeout.connect(self._zoom_step)
+
+        # Update mode follows the module count (see set_module_count).
+        # Antialiasing is off, so skip its margin; no item paint() leaves
+        # the painter modified, so skip the per-item save/restore too
+        self.set_module_count(0)
+        self.setOptimizationFlags(
+            QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing
+            | QGraphicsView.OptimizationFlag.DontSavePainterState
+        )
+
+        # Keep the rendered grid in a pixmap: repaints blit it, pans only
+        # draw the newly exposed strip, and zooms invalidate it wholesale.
+        # QGraphicsView ignores the background cache on a GL viewport.
+        if not self._gl_viewport:
+            self.setCacheMode(QGraphicsView.CacheModeFlag.CacheBackground)
+
+        # Scroll bars are looked up on every pan step; they never change
+        self._hbar = self.horizontalScrollBar()
+        self._vbar = self.verticalScrollBar()
+
         self._pan_accum_x = 0
         self._pan_accum_y = 0
 
-        # Mouse panning
-        self.last_mouse_pos = None
+        # Mouse panning (Qt's ScrollHandDrag does the scrolling)
         self.panning = False
 
         # Drag-selection
         self.drag_selecting = False
         self.drag_start_scene_pos = None
         self.selection_rect_item: QGraphicsRectItem | None = None
+        self._current_selection: set[ModuleItem] = set()
 
         # Touch support
         self.setAttribute(Qt.WidgetAttribute.WA_AcceptTouchEvents, True)
@@ -49,6 +97,7 @@ class WorkspaceView(QGraphicsView):
         self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
 
         self._native_gesture_active = False
+        self._pinch_anchor: QPointF | None = None  # scene point under a touch pinch
 
         # Touch scrolling state
         self.touch_last_pos: QPointF | None = None
@@ -69,17 +118,56 @@ class WorkspaceView(QGraphicsView):
         self._touch_move_threshold = 20
 
     # ---------- Mouse ----------
+    def set_module_count(self, count: int):
+        """
+        Pick the viewport update mode for a scene holding `count` modules.
+
+        An OpenGL viewport repaints in full regardless, so it always uses
+        FullViewportUpdate. On a raster viewport, SmartViewportUpdate is
+        cheaper until there are so many items that tracking their dirty
+        regions costs more than repainting everything.
+        """
+        if self._gl_viewport or count > self.FULL_UPDATE_MODULE_COUNT:
+            mode = QGraphicsView.ViewportUpdateMode.FullViewportUpdate
+        else:
+            mode = QGraphicsView.ViewportUpdateMode.SmartViewportUpdate
+        if self.viewportUpdateMode() != mode:
+            self.setViewportUpdateMode(mode)
+
     def wheelEvent(self, event: QWheelEvent):
         # --- First try touchpad handling ---
         if self._handle_touchpad_wheel(event):
             return
         # --- Fallback: mouse wheel zoom ---
         zoom = self.zoom_factor if event.angleDelta().y() > 0 else 1 / self.zoom_factor
-        self.scale(zoom, zoom)
+        self._zoom_pending_log += math.log(zoom)
+        if not self._zoom_timer.isActive():
+            self._zoom_step()
+            self._zoom_timer.start()
+
+    ZOOM_STEP_FRACTION = 0.35  # share of the remaining zoom applied per frame
+
+    def _zoom_step(self):
+        """Apply one frame of the pending wheel zoom."""
+        # Scale is a multiplicative quantity, so interpolating in log space
+        # is the geodesic between zoom levels: each frame covers the same
+        # fraction of the remaining distance, whatever the absolute zoom,
+        # and new wheel ticks simply extend the remaining distance.
+        remaining = self._zoom_pending_log
+        if abs(remaining) < 1e-3:
+            step = remaining
+        else:
+            step = remaining * self.ZOOM_STEP_FRACTION
+        self._zoom_pending_log = remaining - step
+        if step:
+            factor = math.exp(step)
+            self.scale(factor, factor)
+        if self._zoom_pending_log == 0.0:
+            self._zoom_timer.stop()
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
-            scene_pos = self.mapToScene(event.pos())
+            scene_pos = self.mapToScene(event.position().toPoint())
             clicked_items = self.scene().items(scene_pos)
 
             # If click is on empty space (no module/node), start drag-selection
@@ -96,26 +184,20 @@ class WorkspaceView(QGraphicsView):
         elif event.button() == Qt.MouseButton.MiddleButton or (
             event.modifiers() & Qt.KeyboardModifier.ControlModifier
         ):
+            # Hand scrolling is built into QGraphicsView but only starts on a
+            # left press that no item accepted, so turn item interaction off
+            # and feed it a left press for the duration of the pan
             self.panning = True
-            self.last_mouse_pos = event.pos()
-            self.setCursor(Qt.CursorShape.ClosedHandCursor)
+            self.setInteractive(False)
+            self.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
+            super().mousePressEvent(self._as_left_button(event))
+            event.accept()
         else:
             super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event):
         if self.drag_selecting and self.drag_start_scene_pos:
-            self._update_selection_rect(self.mapToScene(event.pos()))
-            event.accept()
-            return
-        elif self.panning and self.last_mouse_pos:
-            delta = event.pos() - self.last_mouse_pos
-            self.last_mouse_pos = event.pos()
-            self.horizontalScrollBar().setValue(
-                self.horizontalScrollBar().value() - int(delta.x())
-            )
-            self.verticalScrollBar().setValue(
-                self.verticalScrollBar().value() - int(delta.y())
-            )
+            self._update_selection_rect(self.mapToScene(event.position().toPoint()))
             event.accept()
             return
         else:
@@ -127,12 +209,25 @@ class WorkspaceView(QGraphicsView):
             event.accept()
             return
         elif self.panning:
+            super().mouseReleaseEvent(self._as_left_button(event))
             self.panning = False
-            self.setCursor(Qt.CursorShape.ArrowCursor)
+            self.setDragMode(QGraphicsView.DragMode.NoDrag)
+            self.setInteractive(True)
             event.accept()
             return
         super().mouseReleaseEvent(event)
 
+    @staticmethod
+    def _as_left_button(event: QMouseEvent) -> QMouseEvent:
+        """Copy of a mouse event re-labelled as a left-button event."""
+        return QMouseEvent(
+            event.type(), event.position(), event.globalPosition(),
+            Qt.MouseButton.LeftButton,
+            Qt.MouseButton.LeftButton if event.type() != QEvent.Type.MouseButtonRelease
+            else Qt.MouseButton.NoButton,
+            event.modifiers(),
+        )
+
     def contextMenuEvent(self, event):
         """Right-click context menu for saving, copying, and pasting modules."""
         menu = QMenu(self)
@@ -287,26 +382,19 @@ class WorkspaceView(QGraphicsView):
         if zoom <= 0:
             return
 
-        global_pos = QCursor.pos()
-        view_pos = self.mapFromGlobal(global_pos)
-        old_scene_pos = self.mapToScene(view_pos)
-
+        # Anchored under the cursor by AnchorUnderMouse
         self.scale(zoom, zoom)
 
-        new_scene_pos = self.mapToScene(view_pos)
-        delta_scene = new_scene_pos - old_scene_pos
-        self.translate(delta_scene.x(), delta_scene.y())
-
     def _handle_native_pinch_pan(self, e: QNativeGestureEvent):
         dx = e.delta().x()
         dy = e.delta().y()
 
         SCROLL = 1.0
-        self.horizontalScrollBar().setValue(
-            self.horizontalScrollBar().value() - int(dx * SCROLL)
+        self._hbar.setValue(
+            self._hbar.value() - int(dx * SCROLL)
         )
-        self.verticalScrollBar().setValue(
-            self.verticalScrollBar().value() - int(dy * SCROLL)
+        self._vbar.setValue(
+            self._vbar.value() - int(dy * SCROLL)
         )
 
     def _handle_touchpad_wheel(self, event: QWheelEvent) -> bool:
@@ -377,11 +465,11 @@ class WorkspaceView(QGraphicsView):
         self._pan_accum_y -= sy
 
         if sx != 0 or sy != 0:
-            self.horizontalScrollBar().setValue(
-                self.horizontalScrollBar().value() - (sx * SCROLL_SCALE)
+            self._hbar.setValue(
+                self._hbar.value() - (sx * SCROLL_SCALE)
             )
-            self.verticalScrollBar().setValue(
-                self.verticalScrollBar().value() - (sy * SCROLL_SCALE)
+            self._vbar.setValue(
+                self._vbar.value() - (sy * SCROLL_SCALE)
             )
 
         event.accept()
@@ -425,6 +513,13 @@ class WorkspaceView(QGraphicsView):
                 self.selection_rect_item = None
                 return
 
+        # Modules selected by the band so far; the first update deselects
+        # whatever it does not cover, as a fresh band should
+        sc = self.scene()
+        self._current_selection = {
+            item for item in sc.selectedItems() if isinstance(item, ModuleItem)
+        } if sc else set()
+
         # Now set rect safely
         try:
             self.selection_rect_item.setRect(QRectF(scene_pos, scene_pos))
@@ -438,11 +533,29 @@ class WorkspaceView(QGraphicsView):
         try:
             rect = self._make_rect(self.drag_start_scene_pos, scene_pos)
             self.selection_rect_item.setRect(rect)
-            # Update module selection
-            for item in self.scene().items():
-                if isinstance(item, ModuleItem):
-                    item_rect = item.sceneBoundingRect()
-                    item.setSelected(rect.intersects(item_rect))
+            # Let the scene index find the modules under the band, then only
+            # touch the ones whose selection actually changes
+            hit = {
+                item for item in self.scene().items(
+                    rect, Qt.ItemSelectionMode.IntersectsItemBoundingRect
+                )
+                if isinstance(item, ModuleItem)
+            }
+            deselect = self._current_selection - hit
+            select = hit - self._current_selection
+            if deselect or select:
+                # One selectionChanged for the whole batch, not one per item
+                sc = self.scene()
+                sc.blockSignals(True)
+                try:
+                    for item in deselect:
+                        item.setSelected(False)
+                    for item in select:
+                        item.setSelected(True)
+                finally:
+                    sc.blockSignals(False)
+                sc.selectionChanged.emit()
+            self._current_selection = hit
         except Exception:
             self.selection_rect_item = None
             self.drag_selecting = False
@@ -458,6 +571,7 @@ class WorkspaceView(QGraphicsView):
                 pass
             self.selection_rect_item = None
         self.drag_start_scene_pos = None
+        self._current_selection = set()
 
     def _make_rect(self, p1: QPointF, p2: QPointF) -> QRectF:
         return QRectF(
@@ -480,11 +594,11 @@ class WorkspaceView(QGraphicsView):
 
     # ---------- Scroll / Inertia ----------
     def _scroll_by_delta(self, delta):
-        self.horizontalScrollBar().setValue(
-            self.horizontalScrollBar().value() - int(delta.x())
+        self._hbar.setValue(
+            self._hbar.value() - int(delta.x())
         )
-        self.verticalScrollBar().setValue(
-            self.verticalScrollBar().value() - int(delta.y())
+        self._vbar.setValue(
+            self._vbar.value() - int(delta.y())
         )
 
     def _update_velocity(self, pos):
@@ -532,18 +646,31 @@ class WorkspaceView(QGraphicsView):
     def gestureEvent(self, event):
         pinch = event.gesture(Qt.GestureType.PinchGesture)
         if pinch and isinstance(pinch, QPinchGesture):
-            center_pt = pinch.centerPoint()
-            if center_pt is None:
-                return False
+            # centerPoint() is in screen coordinates
+            center = self.viewport().mapFromGlobal(pinch.centerPoint().toPoint())
+            state = pinch.state()
+
+            # Map the gesture centre to the scene once per gesture; every
+            # frame then keeps that scene point under the fingers, which
+            # also pans when the fingers move together
+            if state == Qt.GestureState.GestureStarted or self._pinch_anchor is None:
+                self._pinch_anchor = self.mapToScene(center)
 
-            scene_center_before = self.mapToScene(center_pt.toPoint())
             if pinch.changeFlags() & QPinchGesture.ChangeFlag.ScaleFactorChanged:
                 scale_factor = pinch.scaleFactor()
                 if scale_factor > 0:
+                    # Anchoring is done below, not at the mouse position
+                    anchor = self.transformationAnchor()
+                    self.setTransformationAnchor(QGraphicsView.ViewportAnchor.NoAnchor)
                     self.scale(scale_factor, scale_factor)
-            scene_center_after = self.mapToScene(center_pt.toPoint())
-            delta_scene = scene_center_after - scene_center_before
-            self.translate(delta_scene.x(), delta_scene.y())
+                    self.setTransformationAnchor(anchor)
+
+            drift = self.mapFromScene(self._pinch_anchor) - center
+            if drift.x() or drift.y():
+                self._scroll_by_delta(-drift)
+
+            if state in (Qt.GestureState.GestureFinished, Qt.GestureState.GestureCanceled):
+                self._pinch_anchor = None
 
             event.accept()
             return True